@@ -4,25 +4,15 @@ from __future__ import annotations
 
 import logging
 import platform
-import sys
 import threading
 
 from .config import CONFIG
 from .http_server import RadarStaticServer
+from .logging_config import configure_logging
 from .network import force_ipv4_connections
 from .scheduler import RadarScheduler
 
 
-def configure_logging() -> None:
-    handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
-    handler.setFormatter(formatter)
-
-    root = logging.getLogger()
-    root.setLevel(logging.INFO)
-    root.addHandler(handler)
-
-
 def _maybe_start_dev_server() -> RadarStaticServer | None:
     should_start = True
     if CONFIG.dev_server.enabled_only_on_macos and platform.system() != "Darwin":
@@ -4,14 +4,29 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 
 BASE_DIR = Path(__file__).resolve().parent
 
+# Directories already created by this process; see ensure_dir.
+_ENSURED_DIRS: set[Path] = set()
 
+
+def ensure_dir(path: Path) -> None:
+    """Create ``path`` (with parents) once per process, skipping the syscall afterwards."""
+    if path in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+@lru_cache(maxsize=None)
 def _get_cpu_count() -> int:
-    """Get the number of available CPU threads."""
+    """Get the number of CPU threads this process may run on (respects affinity)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
     return max(1, os.cpu_count() or 1)
 
 
@@ -37,6 +52,9 @@ class StorageConfig:
     min_tracked_files: int = 12
     max_tracked_files: int = 600 # little over 2 hours of data
     max_forecast_files: int = 12 # 1 hour of data
+    # HDF5 chunk cache, sized to hold a full chunk so reads are not fragmented
+    hdf_chunk_cache_bytes: int = 8 * 1024 * 1024
+    hdf_chunk_cache_slots: int = 12289  # prime, per h5py recommendations
 
 
 @dataclass(frozen=True)
@@ -44,6 +62,7 @@ class DevServerConfig:
     host: str = "0.0.0.0"
     port: int = 8080
     enabled_only_on_macos: bool = True
+    cache_max_age: int = 60  # seconds, Cache-Control for served PNGs
 
 
 @dataclass(frozen=True)
@@ -94,13 +113,9 @@ class RenderingConfig:
         "#A40003",
         "#FCFCFC",
     )
-    overlay_target_dpi: int = 72
-    overlay_retina_dpi: int = 144
-    main_map_dpi: int = 300
-    base_figure_width_inches: float = 12.0
     # Parallel processing configuration
-    max_workers: int = field(default_factory=_get_cpu_count)  # Number of worker threads for parallel rendering
-    optimize_workers: int = field(default_factory=_get_optimize_workers)  # Number of worker threads for PNG optimization
+    max_workers: int = field(default_factory=_get_cpu_count)  # Number of render worker processes
+    optimize_workers: int = field(default_factory=_get_optimize_workers)  # oxipng thread budget, split across render processes
 
 
 @dataclass(frozen=True)
@@ -119,7 +134,7 @@ class Config:
             self.storage.forecast_data_dir,
             self.storage.forecast_output_dir,
         ):
-            path.mkdir(parents=True, exist_ok=True)
+            ensure_dir(path)
 
 
 CONFIG = Config()
@@ -2,64 +2,117 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
-import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterator, Optional, Sequence
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import ensure_dir
 
 LOGGER = logging.getLogger(__name__)
 TIMEOUT = 30
 MAX_RETRIES = 4
-RETRY_DELAY = 2.0
-
-from .network import force_ipv4_connections
-force_ipv4_connections()
-
+RETRY_BACKOFF = 0.5  # seconds, doubled per attempt by urllib3
+RETRY_JITTER = 0.5  # seconds of random spread added to each backoff
+RETRY_STATUSES = (500, 502, 503, 504)
+COPY_BUFFER_SIZE = 1 << 20
+HREF_PATTERN = re.compile(rb'href="([^"]+)"', re.IGNORECASE)
+ALLOWED_SUFFIXES = (".hdf", ".tar")
+
+
+def _retry_policy() -> Retry:
+    options = dict(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    try:
+        return Retry(**options, backoff_jitter=RETRY_JITTER)
+    except TypeError:  # urllib3 < 2 has no jitter support
+        return Retry(**options)
+
+
+def _create_session() -> requests.Session:
+    """Shared keep-alive session with urllib3-driven retries and backoff."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry_policy())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip"
+    return session
+
+
+SESSION = _create_session()
+# base_url -> (conditional request headers, parsed filenames) of the last listing
+_LISTINGS: dict[str, tuple[dict[str, str], list[str]]] = {}
+
+
+def _request_with_retry(
+    url: str, stream: bool = False, headers: Optional[dict[str, str]] = None
+) -> Optional[requests.Response]:
+    """GET ``url`` through the shared session; retries happen inside the adapter."""
+    try:
+        response = SESSION.get(url, timeout=TIMEOUT, stream=stream, headers=headers)
+        response.raise_for_status()
+        return response
+    except RequestException as exc:
+        LOGGER.error("Request failed for %s: %s", url, exc)
+        return None
 
-def _request_with_retry(url: str, stream: bool = False) -> Optional[requests.Response]:
-    last_error: RequestException | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            response = requests.get(url, timeout=TIMEOUT)
-            response.raise_for_status()
-            return response
-        except RequestException as exc:
-            last_error = exc
-            LOGGER.warning("Request failed for %s (attempt %d/%d): %s", url, attempt, MAX_RETRIES, exc)
-            time.sleep(RETRY_DELAY * attempt)
-    if last_error:
-        LOGGER.error("Giving up on %s after %d attempts: %s", url, MAX_RETRIES, last_error)
-    return None
 
+def list_remote_files(base_url: str, limit: Optional[int] = None) -> list[str]:
+    """Return archive filenames from a directory listing, newest first.
 
-def list_remote_files(base_url: str) -> list[str]:
+    With ``limit`` only the ``limit`` newest entries are kept, which avoids
+    sorting the whole listing.
+    """
     LOGGER.debug("Listing remote files from %s", base_url)
-    response = _request_with_retry(base_url)
+    # Revalidate the previous listing: an unchanged directory answers 304
+    # with no body, so quick-mode polling neither downloads nor parses it.
+    cached = _LISTINGS.get(base_url)
+    response = _request_with_retry(base_url, headers=cached[0] if cached else None)
     if response is None:
         return []
 
+    if cached and response.status_code == 304:
+        entries = cached[1]
+    else:
+        entries = _parse_listing(response.content)
+        validators = {
+            request_header: response.headers[response_header]
+            for response_header, request_header in (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since"))
+            if response_header in response.headers
+        }
+        if validators:
+            _LISTINGS[base_url] = (validators, entries)
+
+    if limit is not None:
+        return heapq.nlargest(limit, entries)
+    return sorted(entries, reverse=True)
+
+
+def _parse_listing(content: bytes) -> list[str]:
+    # Scan the raw bytes; the listing is ASCII so there is no need to decode it.
     entries: list[str] = []
-    href_pattern = re.compile(r'href="([^"]+)"', re.IGNORECASE)
-    allowed_suffixes = (".hdf", ".tar")
-
-    for line in response.text.splitlines():
-        match = href_pattern.search(line)
-        if not match:
-            continue
-        candidate = match.group(1)
-        filename = candidate.rsplit("/", maxsplit=1)[-1]
-        if filename.lower().endswith(allowed_suffixes):
+    for match in HREF_PATTERN.finditer(content):
+        filename = match.group(1).rsplit(b"/", maxsplit=1)[-1].decode("ascii", "ignore")
+        if filename.lower().endswith(ALLOWED_SUFFIXES):
             entries.append(filename)
-    entries.sort(reverse=True)
     return entries
 
 
 def download_file(base_url: str, filename: str, destination: Path) -> Optional[Path]:
-    destination.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(destination.parent)
     url = base_url + filename
     LOGGER.info("Downloading %s", url)
     response = _request_with_retry(url, stream=True)
@@ -68,18 +121,40 @@ def download_file(base_url: str, filename: str, destination: Path) -> Optional[P
             destination.unlink(missing_ok=True)
         return None
 
-    with destination.open("wb") as fp:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                fp.write(chunk)
+    with response, destination.open("wb") as fp:
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, fp, length=COPY_BUFFER_SIZE)
     return destination
 
 
+def iter_downloads(
+    base_url: str,
+    filenames: Sequence[str],
+    destinations: Sequence[Path],
+    workers: int = 4,
+) -> Iterator[tuple[Path, Optional[Path]]]:
+    """Download several files concurrently, yielding ``(destination, result)`` as each one finishes."""
+    if len(filenames) != len(destinations):
+        raise ValueError("filenames and destinations must have same length")
+    if not filenames:
+        return
+
+    with _download_pool(len(filenames), workers) as executor:
+        futures = {
+            executor.submit(download_file, base_url, filename, destination): destination
+            for filename, destination in zip(filenames, destinations)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _download_pool(count: int, workers: int) -> ThreadPoolExecutor:
+    # Capped so a cold-start catch-up does not hammer the upstream server.
+    return ThreadPoolExecutor(max_workers=max(1, min(workers, count)))
+
+
 def download_tar(base_url: str, filename: str, destination: Path) -> Optional[Path]:
     return download_file(base_url, filename, destination)
 
 
-def iter_latest(entries: Iterable[str], limit: int) -> list[str]:
-    return list(entries)[:limit]
-
 
@@ -3,27 +3,36 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import tarfile
 from pathlib import Path
 from typing import List
 
+from .config import ensure_dir
+
 LOGGER = logging.getLogger(__name__)
+COPY_BUFFER_SIZE = 1 << 20
 
 
 def extract_forecast_tar(tar_path: Path, target_dir: Path) -> List[Path]:
-    target_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(target_dir)
     extracted: List[Path] = []
 
     LOGGER.info("Extracting forecast TAR %s", tar_path.name)
     with tarfile.open(tar_path, "r") as archive:
-        for member in archive.getmembers():
-            if member.isfile() and member.name.endswith(".hdf"):
-                archive.extract(member, path=target_dir)
-                extracted_path = target_dir / member.name
-                final_path = target_dir / extracted_path.name
-                if extracted_path != final_path:
-                    extracted_path.rename(final_path)
-                extracted.append(final_path)
+        # Iterate lazily and stream each member straight to its flattened
+        # destination; avoids materialising the member list and the
+        # extract-then-rename round trip for nested entries.
+        for member in archive:
+            if not (member.isfile() and member.name.endswith(".hdf")):
+                continue
+            source = archive.extractfile(member)
+            if source is None:
+                continue
+            final_path = target_dir / Path(member.name).name
+            with source, final_path.open("wb") as destination:
+                shutil.copyfileobj(source, destination, length=COPY_BUFFER_SIZE)
+            extracted.append(final_path)
 
     LOGGER.debug("Extracted %d forecast files", len(extracted))
     return extracted
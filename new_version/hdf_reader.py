@@ -10,6 +10,9 @@ from typing import Tuple
 import h5py
 import numpy as np
 
+from .config import CONFIG
+from .naming import parse_timestamp
+
 
 @dataclass(frozen=True)
 class RadarMetadata:
@@ -32,38 +35,75 @@ def _decode_attr(attr) -> str:
     return str(attr)
 
 
-def load_radar_hdf(path: Path) -> RadarProduct:
-    with h5py.File(path, "r") as dataset:
-        date = _decode_attr(dataset["what"].attrs["date"])  # YYYYMMDD
-        time = _decode_attr(dataset["what"].attrs["time"])  # HHMMSS
-        timestamp = datetime.strptime(f"{date}{time}", "%Y%m%d%H%M%S")
-
-        where = dataset["where"].attrs
-        bounds = (float(where["LL_lon"]), float(where["UR_lon"]), float(where["LL_lat"]), float(where["UR_lat"]))
-        xsize = int(where["xsize"])
-        ysize = int(where["ysize"])
+def _to_reflectivity(raw: np.ndarray, gain: float, offset: float, nodata: int, undetect: int) -> np.ndarray:
+    """Convert raw ODIM counts to dBZ (NaN for nodata, -32 for undetect)."""
+    if raw.dtype in (np.uint8, np.uint16):
+        # Every possible count maps to a fixed dBZ, so build the table once and
+        # gather through it: one pass over the grid, no masks or temporaries.
+        lut = np.arange(np.iinfo(raw.dtype).max + 1, dtype=np.float32)
+        lut *= np.float32(gain)
+        lut += np.float32(offset)
+        if 0 <= nodata < lut.size:
+            lut[nodata] = np.nan
+        if 0 <= undetect < lut.size:
+            lut[undetect] = -32.0
+        return lut[raw]
+
+    # Single fused pass: scale everything, then patch the two sentinel values.
+    reflectivity = np.empty(raw.shape, dtype=np.float32)
+    np.multiply(raw, gain, out=reflectivity, dtype=np.float32)
+    reflectivity += offset
+    np.putmask(reflectivity, raw == nodata, np.nan)
+    np.putmask(reflectivity, raw == undetect, -32.0)
+    return reflectivity
+
+
+def _open_hdf(path: Path) -> h5py.File:
+    return h5py.File(
+        path,
+        "r",
+        rdcc_nbytes=CONFIG.storage.hdf_chunk_cache_bytes,
+        rdcc_nslots=CONFIG.storage.hdf_chunk_cache_slots,
+    )
 
-        data_group = dataset["dataset1/data1"]
-        raw = data_group["data"][...]
 
-        gain = float(data_group["what"].attrs["gain"])
-        offset = float(data_group["what"].attrs["offset"])
-        nodata = int(data_group["what"].attrs["nodata"])
-        undetect = int(data_group["what"].attrs["undetect"])
+def _read_metadata(dataset: h5py.File, data_what: h5py.AttributeManager) -> RadarMetadata:
+    # Open each group's attribute set once; every key read is still a C call
+    what = dataset["what"].attrs
+    date = _decode_attr(what["date"])  # YYYYMMDD
+    time = _decode_attr(what["time"])  # HHMMSS
+    timestamp = parse_timestamp(date, time)
 
-    reflectivity = np.full(raw.shape, np.nan, dtype=np.float32)
-    valid_mask = (raw != nodata) & (raw != undetect)
-    reflectivity[valid_mask] = raw[valid_mask] * gain + offset
-    reflectivity[raw == undetect] = -32.0
+    where = dataset["where"].attrs
+    bounds = (float(where["LL_lon"]), float(where["UR_lon"]), float(where["LL_lat"]), float(where["UR_lat"]))
+    xsize = int(where["xsize"])
+    ysize = int(where["ysize"])
 
-    metadata = RadarMetadata(
+    return RadarMetadata(
         timestamp=timestamp,
         bounds=bounds,
         grid_shape=(ysize, xsize),
-        nodata=nodata,
-        undetect=undetect,
+        nodata=int(data_what["nodata"]),
+        undetect=int(data_what["undetect"]),
     )
 
-    return RadarProduct(data=reflectivity, metadata=metadata)
 
+def _read_data(raw_dataset: h5py.Dataset, data_what: h5py.AttributeManager, metadata: RadarMetadata) -> np.ndarray:
+    # Size from the dataset itself, not the ``where`` attrs, which may disagree
+    raw = np.empty(raw_dataset.shape, dtype=raw_dataset.dtype)
+    raw_dataset.read_direct(raw)
 
+    gain = float(data_what["gain"])
+    offset = float(data_what["offset"])
+    return _to_reflectivity(raw, gain, offset, metadata.nodata, metadata.undetect)
+
+
+def load_radar_hdf(path: Path) -> RadarProduct:
+    with _open_hdf(path) as dataset:
+        data_group = dataset["dataset1/data1"]
+        # nodata/undetect and gain/offset all come from this one attribute set
+        data_what = data_group["what"].attrs
+        metadata = _read_metadata(dataset, data_what)
+        reflectivity = _read_data(data_group["data"], data_what, metadata)
+
+    return RadarProduct(data=reflectivity, metadata=metadata)
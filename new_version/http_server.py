@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import contextlib
+import html
 import http.server
+import io
 import logging
+import os
 import urllib.parse
+from http import HTTPStatus
 from pathlib import PurePosixPath
 
-from .config import CONFIG
+from .config import CONFIG, ensure_dir
 
 LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +26,8 @@ class RadarStaticRequestHandler(http.server.SimpleHTTPRequestHandler):
         "output_extended": CONFIG.storage.extended_output_dir,
     }
 
+    _status: int | None = None
+
     def translate_path(self, path: str) -> str:  # pragma: no cover - thin wrapper
         parsed = urllib.parse.urlparse(path)
         parts = [part for part in PurePosixPath(parsed.path).parts if part not in {"", "/"}]
@@ -37,6 +43,43 @@ class RadarStaticRequestHandler(http.server.SimpleHTTPRequestHandler):
         safe_path = root.joinpath(*remainder)
         return str(safe_path)
 
+    def list_directory(self, path):
+        """Directory listing built from a single ``scandir`` pass (no per-entry stat)."""
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(
+                    ((entry.name, entry.is_dir()) for entry in it),
+                    key=lambda item: item[0].lower(),
+                )
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "No permission to list directory")
+            return None
+
+        title = html.escape(f"Directory listing for {urllib.parse.unquote(self.path)}", quote=False)
+        lines = [f"<!DOCTYPE HTML>\n<html>\n<head><title>{title}</title></head>\n<body>\n<h1>{title}</h1>\n<ul>"]
+        for name, is_dir in entries:
+            link = name + "/" if is_dir else name
+            lines.append(f'<li><a href="{urllib.parse.quote(link)}">{html.escape(link, quote=False)}</a></li>')
+        lines.append("</ul>\n</body>\n</html>\n")
+        encoded = "\n".join(lines).encode("utf-8", "surrogateescape")
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        return io.BytesIO(encoded)
+
+    def send_response(self, code, message=None) -> None:
+        self._status = code
+        super().send_response(code, message)
+
+    def end_headers(self) -> None:
+        # Overlays can be re-rendered, so only cache briefly, and only actual
+        # files: a 404 for a frame that is not rendered yet must not stick.
+        if self._status == HTTPStatus.OK and urllib.parse.urlparse(self.path).path.endswith(".png"):
+            self.send_header("Cache-Control", f"public, max-age={CONFIG.dev_server.cache_max_age}")
+        super().end_headers()
+
 
 class RadarStaticServer:
     """Lightweight HTTP server exposing processed assets locally."""
@@ -51,7 +94,7 @@ class RadarStaticServer:
             raise RuntimeError("Static server already running")
 
         for path in RadarStaticRequestHandler.MOUNT_POINTS.values():
-            path.mkdir(parents=True, exist_ok=True)
+            ensure_dir(path)
 
         handler = RadarStaticRequestHandler
         self._httpd = http.server.ThreadingHTTPServer((self.host, self.port), handler)
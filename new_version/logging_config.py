@@ -0,0 +1,16 @@
+"""Shared logging setup for the scheduler process and its render workers."""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    handler = logging.StreamHandler(sys.stdout)
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(handler)
@@ -4,18 +4,42 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 TIMESTAMP_PATTERN = re.compile(r"(\d{8})(\d{6})")
+# Forecast TARs carry YYYYMMDD.HHMM in the filename
+FORECAST_TIMESTAMP_PATTERN = re.compile(r"(\d{8})\.(\d{4})")
+# Extracted forecast HDFs end in _ft<minutes>
+FORECAST_OFFSET_PATTERN = re.compile(r"_ft(\d+)$")
+# radar_YYYYMMDD_HHMM_<variant>.png; group 1 is the timestamp stub
+OVERLAY_STUB_PATTERN = re.compile(r"radar_(\d{8}_\d{4})_")
 
 
+def parse_timestamp(date_part: str, time_part: str) -> datetime:
+    """Build a datetime from ``YYYYMMDD`` and ``HHMMSS`` strings.
+
+    Slices the digits directly; ``datetime.strptime`` is far slower and this
+    runs for every listing entry and every loaded file.
+    """
+    return datetime(
+        int(date_part[0:4]),
+        int(date_part[4:6]),
+        int(date_part[6:8]),
+        int(time_part[0:2]),
+        int(time_part[2:4]),
+        int(time_part[4:6]),
+    )
+
+
+@lru_cache(maxsize=4096)
 def extract_timestamp(name: str) -> Optional[datetime]:
     match = TIMESTAMP_PATTERN.search(name)
     if not match:
         return None
     date_part, time_part = match.groups()
-    return datetime.strptime(f"{date_part}{time_part}", "%Y%m%d%H%M%S")
+    return parse_timestamp(date_part, time_part)
 
 
 def timestamp_stub(ts: datetime) -> str:
@@ -33,21 +57,19 @@ def local_radar_hdf(path: Path) -> Path:
     return path
 
 
+@lru_cache(maxsize=4096)
 def extract_forecast_timestamp(filename: str) -> Optional[datetime]:
     """Extract timestamp from forecast TAR filename.
 
     Expected format: T_PABV23_C_OKPR_YYYYMMDD.HHMM.ft60s10.tar
     """
-    import re
-    # Pattern: YYYYMMDD.HHMM in the filename
-    pattern = r"(\d{8})\.(\d{4})"
-    match = re.search(pattern, filename)
+    match = FORECAST_TIMESTAMP_PATTERN.search(filename)
     if not match:
         return None
 
     date_part, time_part = match.groups()
     # Convert HHMM to HHMM00 (add seconds)
     full_time = time_part + "00"
-    return datetime.strptime(f"{date_part}{full_time}", "%Y%m%d%H%M%S")
+    return parse_timestamp(date_part, full_time)
 
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import socket
+from functools import lru_cache
 
 import urllib3.util.connection as urllib3_connection
 
 
+@lru_cache(maxsize=1)
 def force_ipv4_connections() -> None:
     """Force requests/urllib3 to use IPv4 only.
 
@@ -15,6 +17,8 @@ def force_ipv4_connections() -> None:
     ``Can't assign requested address``. By overriding urllib3's address family
     resolution we ensure all outgoing radar fetches use IPv4, matching the
     behaviour of the legacy implementation.
+
+    Called once from ``__main__``; repeated calls are no-ops.
     """
 
     def allowed_gai_family():
@@ -2,18 +2,68 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
-from .config import CONFIG
+from .config import CONFIG, ensure_dir
 from .hdf_reader import load_radar_hdf
-from .naming import overlay_filename
-from .png_renderer import render_overlays, render_overlays_extended
+from .logging_config import configure_logging
+from .naming import overlay_filename, timestamp_stub
+from .png_renderer import OVERLAY_VARIANTS, render_overlays, render_overlays_extended
 
 LOGGER = logging.getLogger(__name__)
 
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _init_worker(log_level: int, optimize_threads: int) -> None:
+    """Mirror the parent's logging setup and cap oxipng's thread pool in a new worker."""
+    # Must be set before oxipng first runs: rayon sizes its global pool once.
+    os.environ["RAYON_NUM_THREADS"] = str(optimize_threads)
+    configure_logging(log_level)
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for CPU-bound rendering (HDF decode, colorize, PNG optimize).
+
+    Created on first use and kept for the life of the process, so steady-state
+    cycles skip interpreter startup and workers keep their per-process caches.
+    Workers are started via forkserver (spawn where unavailable) so they never
+    inherit the scheduler's threads or open sockets from a fork. The oxipng
+    thread budget is split across the workers so they do not oversubscribe
+    the cores. Worker processes themselves start lazily, as tasks arrive.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            workers = max(1, CONFIG.rendering.max_workers)
+            optimize_threads = max(1, CONFIG.rendering.optimize_workers // workers)
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(logging.getLogger().getEffectiveLevel(), optimize_threads),
+            )
+        return _POOL
+
+
+def shutdown_pool() -> None:
+    """Stop the shared render pool; the next batch starts a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
 
 def generate_pngs(hdf_path: Path, forecast: bool = False, offset_minutes: int | None = None) -> Dict[str, Path]:
     product = load_radar_hdf(hdf_path)
@@ -23,45 +73,47 @@ def generate_pngs(hdf_path: Path, forecast: bool = False, offset_minutes: int |
         raise ValueError("forecast PNG generation requires offset_minutes")
 
     output_dir = CONFIG.storage.forecast_output_dir if forecast else CONFIG.storage.radar_output_dir
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create a base path for temporary overlay generation
-    # Using timestamp stub as the base name
-    ts_stub = ts.strftime("%Y%m%d_%H%M")
-    suffix = ""
-    if forecast and offset_minutes is not None:
-        suffix = f"_forecast_fct{offset_minutes:02d}"
-    elif forecast:
-        suffix = "_forecast"
-    base_name = f"radar_{ts_stub}{suffix}.png"
-    base_path = output_dir / base_name
-
-    result = {}
+    ensure_dir(output_dir)
 
-    overlays = render_overlays(product, base_path)
-
-    for variant, path in overlays.items():
-        overlay_name = overlay_filename(ts, variant, forecast=forecast, offset=offset_minutes)
-        target_path = output_dir / overlay_name
-        path.rename(target_path)
-        result[variant] = target_path
+    targets = {
+        variant: output_dir / overlay_filename(ts, variant, forecast=forecast, offset=offset_minutes)
+        for variant in OVERLAY_VARIANTS
+    }
+    result = render_overlays(product, targets)
 
     LOGGER.info("Generated %d PNG variants for %s", len(result), hdf_path.name)
     return result
 
 
-def generate_pngs_batch(hdf_paths: List[Path], forecast: bool = False, offset_minutes_list: List[int | None] = None) -> Dict[Path, Dict[str, Path]]:
-    """Generate PNGs for multiple HDF files in parallel."""
+def generate_pngs_batch(
+    hdf_paths: Iterable[Path],
+    forecast: bool = False,
+    offset_minutes_list: List[int | None] = None,
+    task_count: int | None = None,
+) -> Dict[Path, Dict[str, Path]]:
+    """Generate PNGs for multiple HDF files in parallel.
+
+    ``hdf_paths`` may be lazy (e.g. files yielded as their downloads finish):
+    each file is submitted as soon as it is yielded, so rendering overlaps
+    with whatever produces the paths. ``task_count`` is the expected number
+    of files, used to size the pool when ``hdf_paths`` has no length.
+    """
+    if task_count is None:
+        hdf_paths = list(hdf_paths)
+        task_count = len(hdf_paths)
     if offset_minutes_list is None:
-        offset_minutes_list = [None] * len(hdf_paths)
-    elif len(offset_minutes_list) != len(hdf_paths):
+        offset_minutes_list = itertools.repeat(None)
+    elif len(offset_minutes_list) != task_count:
         raise ValueError("offset_minutes_list must have same length as hdf_paths")
 
     # Process files in parallel batches
     results = {}
+    if not task_count:
+        return results
 
-    with ThreadPoolExecutor(max_workers=CONFIG.rendering.max_workers) as executor:
-        # Submit all tasks
+    executor = _process_pool()
+    try:
+        # Submit each task as its path arrives
         future_to_path = {
             executor.submit(generate_pngs, hdf_path, forecast, offset_minutes): hdf_path
             for hdf_path, offset_minutes in zip(hdf_paths, offset_minutes_list)
@@ -77,6 +129,9 @@ def generate_pngs_batch(hdf_paths: List[Path], forecast: bool = False, offset_mi
             except Exception as e:
                 LOGGER.error("Failed to process %s: %s", hdf_path.name, e)
                 raise
+    except BrokenProcessPool:
+        shutdown_pool()  # a worker died; start clean next time
+        raise
 
     return results
 
@@ -85,20 +140,11 @@ def generate_pngs_extended(hdf_path: Path) -> Dict[str, Path]:
     ts = product.metadata.timestamp
 
     output_dir = CONFIG.storage.extended_output_dir
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    ts_stub = ts.strftime("%Y%m%d_%H%M")
-    base_name = f"radar_{ts_stub}.png"
-    base_path = output_dir / base_name
-
-    result = {}
-    overlays = render_overlays_extended(product, base_path)
+    ensure_dir(output_dir)
 
-    for variant, path in overlays.items():
-        overlay_name = f"radar_{ts_stub}_{variant}_extended.png"
-        target_path = output_dir / overlay_name
-        path.rename(target_path)
-        result[variant] = target_path
+    ts_stub = timestamp_stub(ts)
+    targets = {variant: output_dir / f"radar_{ts_stub}_{variant}_extended.png" for variant in OVERLAY_VARIANTS}
+    result = render_overlays_extended(product, targets)
 
     LOGGER.info("Generated %d extended PNG variants for %s", len(result), hdf_path.name)
     return result
@@ -106,8 +152,11 @@ def generate_pngs_extended(hdf_path: Path) -> Dict[str, Path]:
 def generate_pngs_extended_batch(hdf_paths: List[Path]) -> Dict[Path, Dict[str, Path]]:
     """Generate extended PNGs for multiple HDF files in parallel."""
     results = {}
+    if not hdf_paths:
+        return results
 
-    with ThreadPoolExecutor(max_workers=CONFIG.rendering.max_workers) as executor:
+    executor = _process_pool()
+    try:
         future_to_path = {
             executor.submit(generate_pngs_extended, hdf_path): hdf_path
             for hdf_path in hdf_paths
@@ -122,6 +171,9 @@ def generate_pngs_extended_batch(hdf_paths: List[Path]) -> Dict[Path, Dict[str,
             except Exception as e:
                 LOGGER.error("Failed to process extended %s: %s", hdf_path.name, e)
                 raise
+    except BrokenProcessPool:
+        shutdown_pool()
+        raise
 
     return results
 
@@ -2,21 +2,18 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import logging
 import os
-import shutil
-import subprocess
+import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple
 
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import numpy as np
+import oxipng
 from PIL import Image
 
 from .config import CONFIG
@@ -25,285 +22,209 @@ from .hdf_reader import RadarProduct
 LOGGER = logging.getLogger(__name__)
 
 
-_OXIPNG_VALIDATED = False
-
-
-def _ensure_oxipng_available() -> None:
-    global _OXIPNG_VALIDATED
-    if _OXIPNG_VALIDATED:
-        return
-
-    if shutil.which("oxipng") is None:
-        raise RuntimeError("oxipng executable not found in PATH; install oxipng to enable PNG optimization")
-
-    _OXIPNG_VALIDATED = True
-
-
-def _run_oxipng(path: Path) -> None:
-    result = subprocess.run(
-        (
-            "oxipng",
-            "--opt",
-            "max",
-            "--strip",
-            "safe",
-            "--alpha",
-            str(path),
-        ),
-        capture_output=True,
-        text=True,
+def _run_oxipng(png: bytes) -> bytes:
+    """Losslessly recompress PNG bytes in-process (equivalent to ``oxipng -o max --strip safe --alpha``)."""
+    return oxipng.optimize_from_memory(
+        png,
+        level=6,
+        strip=oxipng.StripChunks.safe(),
+        optimize_alpha=True,
     )
 
-    if result.returncode != 0:
-        raise RuntimeError(f"oxipng optimization failed for {path.name}: {result.stderr.strip()}")
-
-
-def _optimize_png(temp_path: Path, final_path: Path, colors: int = 16) -> None:
-    """Optimize PNG from temp_path and atomically rename to final_path."""
-    if not temp_path.exists():
-        raise FileNotFoundError(temp_path)
-
-    _ensure_oxipng_available()
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a uniquely named sibling and an atomic rename.
+
+    Ensures Caddy never serves a partially written file, and concurrent writers
+    of the same target never share a temp file.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            os.fchmod(fp.fileno(), 0o644)  # mkstemp creates 0600; the web server must read it
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+
+
+def _optimize_png(image: Image.Image, final_path: Path) -> None:
+    """Optimize a rendered (paletted) overlay, then atomically write it to final_path."""
     start_time = time.perf_counter()
-    original_size = temp_path.stat().st_size
 
-    # Quantization phase
-    quantize_start = time.perf_counter()
-    with Image.open(temp_path) as image:
-        optimized = image.quantize(colors=colors, method=Image.FASTOCTREE, dither=Image.Dither.NONE)
-        quantize_time = time.perf_counter() - quantize_start
-
-        # Save phase - minimal options since oxipng handles compression
-        save_start = time.perf_counter()
-        optimized.save(temp_path, format="PNG")
-        save_time = time.perf_counter() - save_start
+    # Save phase - fastest deflate, oxipng redoes compression anyway
+    save_start = time.perf_counter()
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=1)
+    save_time = time.perf_counter() - save_start
+    original_size = buffer.tell()
 
     # oxipng phase
     oxipng_start = time.perf_counter()
-    _run_oxipng(temp_path)
+    png = _run_oxipng(buffer.getvalue())
     oxipng_time = time.perf_counter() - oxipng_start
 
+    _atomic_write(final_path, png)
+
     total_time = time.perf_counter() - start_time
-    optimized_size = temp_path.stat().st_size
+    optimized_size = len(png)
     savings = (1 - optimized_size / original_size) * 100 if original_size else 0.0
     
     LOGGER.info(
-        "Optimized %s: %.1fKB → %.1fKB (%.1f%%) | quantize=%.0fms save=%.0fms oxipng=%.0fms total=%.0fms",
+        "Optimized %s: %.1fKB → %.1fKB (%.1f%%) | save=%.0fms oxipng=%.0fms total=%.0fms",
         final_path.name,
         original_size / 1024,
         optimized_size / 1024,
         savings,
-        quantize_time * 1000,
         save_time * 1000,
         oxipng_time * 1000,
         total_time * 1000,
     )
 
-    # Atomic rename: ensures Caddy never serves a partially optimized file
-    os.rename(temp_path, final_path)
 
+def _build_color_lut(color_steps: Tuple[str, ...]) -> np.ndarray:
+    """RGBA lookup table: one opaque row per color step plus a transparent last row."""
+    rows = [(int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16), 255) for c in color_steps]
+    rows.append((255, 255, 255, 0))
+    return np.array(rows, dtype=np.uint8)
 
-def _create_colormap() -> Tuple[mcolors.ListedColormap, mcolors.BoundaryNorm]:
-    cmap = mcolors.ListedColormap(CONFIG.rendering.color_steps)
-    bounds = list(range(4, 68, 4))
-    return cmap, mcolors.BoundaryNorm(bounds, cmap.N)
 
+# 4 dBZ steps; values below the first bound (and NaN) are transparent,
+# values at/above the last bound clamp to the top color. Built once at import:
+# CONFIG is frozen, so the palettes cannot change for the life of the process.
+COLOR_LUT = _build_color_lut(CONFIG.rendering.color_steps)
+COLOR_BOUNDS = np.arange(4, 68, 4, dtype=np.float32)
+EXTENDED_COLOR_LUT = _build_color_lut(CONFIG.rendering.extended_color_steps)
+EXTENDED_COLOR_BOUNDS = np.arange(-12, 68, 4, dtype=np.float32)
 
-def _mask_reflectivity(data: np.ndarray) -> np.ndarray:
-    masked = data.copy()
-    masked[masked < 4] = np.nan
-    return masked
+OVERLAY_VARIANTS: Dict[str, int] = {
+    "overlay": 1,
+    "overlay2x": 2,
+}
 
 
-def _render_single_overlay(product: RadarProduct, base_path: Path, name: str, dpi: int, scale: int) -> Tuple[str, Path, Path]:
-    """Render a single overlay variant to a temp file."""
-    start_time = time.perf_counter()
-    
-    cmap, norm = _create_colormap()
-    lon_min, lon_max, lat_min, lat_max = product.metadata.bounds
-    projection_extent = [lon_min, lon_max, lat_max, lat_min]
+@lru_cache(maxsize=8)
+def _position_rows(ncolors: int) -> np.ndarray:
+    """Map a ``searchsorted`` position to a LUT row.
 
-    target_width = product.metadata.grid_shape[1] * scale
-    target_height = product.metadata.grid_shape[0] * scale
-    figsize = (target_width / dpi, target_height / dpi)
+    Position 0 (below the first bound) is the transparent last row; positions
+    past the last bound clamp to the top color. Depends only on the palette
+    size, so each table is built once and shared (read-only).
+    """
+    rows = np.array([ncolors, *range(ncolors), ncolors - 1], dtype=np.uint8)
+    rows.flags.writeable = False
+    return rows
 
-    # Matplotlib rendering phase
-    render_start = time.perf_counter()
-    fig, ax = plt.subplots(figsize=figsize)
-    ax.axis("off")
-    masked = _mask_reflectivity(product.data)
-    ax.imshow(
-        masked,
-        extent=projection_extent,
-        cmap=cmap,
-        norm=norm,
-        interpolation="nearest",
-        origin="upper",
-        aspect="auto",
-    )
-    plt.subplots_adjust(0, 0, 1, 1)
-    render_time = time.perf_counter() - render_start
 
-    final_path = base_path.with_name(f"{base_path.stem}_{name}{base_path.suffix}")
-    temp_path = final_path.with_suffix(".tmp.png")
-    
-    # Matplotlib save phase
-    save_start = time.perf_counter()
-    fig.savefig(temp_path, dpi=dpi, transparent=True, bbox_inches="tight", pad_inches=0)
-    save_time = time.perf_counter() - save_start
-    plt.close(fig)
+def _color_indices(data: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """Map reflectivity to LUT rows; the last row (transparent) marks no echo."""
+    # float32 in, uint8 out: no float64 upcast and no wide intermediate masks
+    data = data.astype(np.float32, copy=False)
+    # searchsorted positions are always valid rows, so the unchecked "clip" take is safe
+    positions = np.searchsorted(bounds, data, side="right")
+    indices = _position_rows(len(bounds) - 1).take(positions, mode="clip")
+    indices[np.isnan(data)] = len(bounds) - 1
+    indices.flags.writeable = False
+    return indices
 
-    total_time = time.perf_counter() - start_time
-    LOGGER.info(
-        "Rendered %s overlay at %dx%d | render=%.0fms save=%.0fms total=%.0fms",
-        name,
-        target_width,
-        target_height,
-        render_time * 1000,
-        save_time * 1000,
-        total_time * 1000,
-    )
-
-    return name, temp_path, final_path
-
-
-def render_overlays(product: RadarProduct, base_path: Path) -> Dict[str, Path]:
-    """Render overlay variants in parallel."""
-    overlay_configs = [
-        ("overlay", CONFIG.rendering.overlay_target_dpi, 1),
-        ("overlay2x", CONFIG.rendering.overlay_retina_dpi, 2),
-    ]
-
-    # Submit all overlay rendering tasks to thread pool
-    with ThreadPoolExecutor(max_workers=CONFIG.rendering.max_workers) as executor:
-        # Submit tasks
-        future_to_config = {
-            executor.submit(_render_single_overlay, product, base_path, name, dpi, scale): (name, dpi, scale)
-            for name, dpi, scale in overlay_configs
-        }
-
-        # Collect results as they complete
-        overlays = {}
-        temp_to_final = {}
-        for future in as_completed(future_to_config):
-            name, temp_path, final_path = future.result()
-            overlays[name] = final_path
-            temp_to_final[temp_path] = final_path
-
-    # Optimize all overlays in parallel, then atomically rename to final paths
-    with ThreadPoolExecutor(max_workers=CONFIG.rendering.optimize_workers) as executor:
-        future_to_paths = {
-            executor.submit(_optimize_png, temp_path, final_path): (temp_path, final_path)
-            for temp_path, final_path in temp_to_final.items()
-        }
-
-        # Wait for all optimizations to complete
-        for future in as_completed(future_to_paths):
-            future.result()  # Will raise exception if optimization failed
-
-    return overlays
-
-def _create_extended_colormap() -> Tuple[mcolors.ListedColormap, mcolors.BoundaryNorm]:
-    cmap = mcolors.ListedColormap(CONFIG.rendering.extended_color_steps)
-    bounds = list(range(-12, 68, 4))
-    return cmap, mcolors.BoundaryNorm(bounds, cmap.N)
-
-
-def _mask_reflectivity_extended(data: np.ndarray) -> np.ndarray:
-    masked = data.copy()
-    masked[masked < -12] = np.nan
-    return masked
 
-def _render_single_overlay_extended(
-    product: RadarProduct,
-    base_path: Path,
+def _render_single_overlay(
+    indices: np.ndarray,
     name: str,
-    dpi: int,
     scale: int,
-) -> Tuple[str, Path, Path]:
-    """Render a single extended overlay variant to a temp file."""
+    lut: np.ndarray = COLOR_LUT,
+) -> Image.Image:
+    """Render a single overlay variant from shared color indices to an in-memory paletted image."""
     start_time = time.perf_counter()
 
-    cmap, norm = _create_extended_colormap()
-    lon_min, lon_max, lat_min, lat_max = product.metadata.bounds
-    projection_extent = [lon_min, lon_max, lat_max, lat_min]
+    target_width = indices.shape[1] * scale
+    target_height = indices.shape[0] * scale
 
-    target_width = product.metadata.grid_shape[1] * scale
-    target_height = product.metadata.grid_shape[0] * scale
-    figsize = (target_width / dpi, target_height / dpi)
-
-    # Matplotlib rendering phase
+    # Indexed image straight from the LUT rows: no RGBA expansion and no
+    # quantize pass, the palette already is the exact set of output colors.
     render_start = time.perf_counter()
-    fig, ax = plt.subplots(figsize=figsize)
-    ax.axis("off")
-    masked = _mask_reflectivity_extended(product.data)
-    ax.imshow(
-        masked,
-        extent=projection_extent,
-        cmap=cmap,
-        norm=norm,
-        interpolation="nearest",
-        origin="upper",
-        aspect="auto",
-    )
-    plt.subplots_adjust(0, 0, 1, 1)
+    if scale > 1:
+        indices = indices.repeat(scale, axis=0).repeat(scale, axis=1)
+    # frombuffer wraps the (contiguous) index array without a tobytes() copy
+    image = Image.frombuffer("P", (target_width, target_height), np.ascontiguousarray(indices), "raw", "P", 0, 1)
+    image.putpalette(lut[:, :3].tobytes())
+    image.info["transparency"] = lut[:, 3].tobytes()
     render_time = time.perf_counter() - render_start
 
-    final_path = base_path.with_name(f"{base_path.stem}_{name}{base_path.suffix}")
-    temp_path = final_path.with_suffix(".tmp.png")
-
-    # Matplotlib save phase
-    save_start = time.perf_counter()
-    fig.savefig(temp_path, dpi=dpi, transparent=True, bbox_inches="tight", pad_inches=0)
-    save_time = time.perf_counter() - save_start
-    plt.close(fig)
-
     total_time = time.perf_counter() - start_time
     LOGGER.info(
-        "Rendered %s extended overlay at %dx%d | render=%.0fms save=%.0fms total=%.0fms",
+        "Rendered %s overlay at %dx%d | render=%.0fms total=%.0fms",
         name,
         target_width,
         target_height,
         render_time * 1000,
-        save_time * 1000,
         total_time * 1000,
     )
 
-    return name, temp_path, final_path
-
-def render_overlays_extended(product: RadarProduct, base_path: Path) -> Dict[str, Path]:
-    """Render extended overlay variants in parallel."""
-    overlay_configs = [
-        ("overlay", CONFIG.rendering.overlay_target_dpi, 1),
-        ("overlay2x", CONFIG.rendering.overlay_retina_dpi, 2),
-    ]
-
-    # Submit all overlay rendering tasks to thread pool
-    with ThreadPoolExecutor(max_workers=CONFIG.rendering.max_workers) as executor:
-        future_to_config = {
-            executor.submit(_render_single_overlay_extended, product, base_path, name, dpi, scale): (name, dpi, scale)
-            for name, dpi, scale in overlay_configs
-        }
-
-        overlays = {}
-        temp_to_final = {}
-        for future in as_completed(future_to_config):
-            name, temp_path, final_path = future.result()
-            overlays[name] = final_path
-            temp_to_final[temp_path] = final_path
-
-    # Optimize all overlays in parallel, then atomically rename to final paths
-    color_count = len(CONFIG.rendering.extended_color_steps)
-    with ThreadPoolExecutor(max_workers=CONFIG.rendering.optimize_workers) as executor:
-        future_to_paths = {
-            executor.submit(_optimize_png, temp_path, final_path, color_count): (temp_path, final_path)
-            for temp_path, final_path in temp_to_final.items()
-        }
-
-        for future in as_completed(future_to_paths):
-            future.result()
+    return image
+
+
+@lru_cache(maxsize=8)
+def _blank_overlay_png(width: int, height: int) -> bytes:
+    """Optimized fully transparent overlay, built once per output size."""
+    image = Image.new("P", (width, height), 0)
+    # Same color as the LUT's transparent row, so blank frames decode identically
+    image.putpalette(bytes((255, 255, 255)))
+    image.info["transparency"] = bytes((0,))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=1)
+    return _run_oxipng(buffer.getvalue())
+
+
+def _write_blank_overlays(shape: Tuple[int, int], targets: Dict[str, Path], label: str = "") -> Dict[str, Path]:
+    """Write the cached transparent PNG for every variant (no echo in the frame)."""
+    height, width = shape
+    overlays = {}
+    for name, scale in OVERLAY_VARIANTS.items():
+        _atomic_write(targets[name], _blank_overlay_png(width * scale, height * scale))
+        overlays[name] = targets[name]
+    LOGGER.info("No echo above the first bound, wrote cached blank%s overlays", label)
+    return overlays
+
 
+def _render_and_optimize(
+    indices: np.ndarray,
+    targets: Dict[str, Path],
+    lut: np.ndarray,
+    label: str = "",
+) -> Dict[str, Path]:
+    """Render and optimize each variant in turn.
+
+    Rendering is a cheap LUT gather; the cost is oxipng, which parallelises
+    internally across filter trials. One call at a time lets it use the whole
+    thread budget instead of several calls contending for the same cores.
+    """
+    if np.all(indices == len(lut) - 1):
+        return _write_blank_overlays(indices.shape, targets, label)
+
+    overlays = {}
+    for name, scale in OVERLAY_VARIANTS.items():
+        image = _render_single_overlay(indices, f"{name}{label}", scale, lut)
+        _optimize_png(image, targets[name])
+        overlays[name] = targets[name]
     return overlays
 
 
+def render_overlays(product: RadarProduct, targets: Dict[str, Path]) -> Dict[str, Path]:
+    """Render overlay variants one after another, writing each to ``targets[variant]``.
+
+    Files are parallelised by the process pool in ``png_pipeline``, not here.
+    """
+    # Classify once; every variant reads the same (read-only) index grid
+    indices = _color_indices(product.data, COLOR_BOUNDS)
+    return _render_and_optimize(indices, targets, COLOR_LUT)
+
+
+def render_overlays_extended(product: RadarProduct, targets: Dict[str, Path]) -> Dict[str, Path]:
+    """Render extended overlay variants one after another, writing each to ``targets[variant]``."""
+    indices = _color_indices(product.data, EXTENDED_COLOR_BOUNDS)
+    return _render_and_optimize(indices, targets, EXTENDED_COLOR_LUT, label=" extended")
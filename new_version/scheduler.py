@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
+import contextlib
+import fnmatch
 import logging
+import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from .config import CONFIG
-from .downloader import download_file, download_tar, iter_latest, list_remote_files
+from .downloader import download_tar, iter_downloads, list_remote_files
 from .forecast import extract_forecast_tar
-from .naming import extract_timestamp, extract_forecast_timestamp
-from .png_pipeline import generate_pngs, generate_pngs_batch, generate_pngs_extended_batch
+from .naming import (
+    FORECAST_OFFSET_PATTERN,
+    OVERLAY_STUB_PATTERN,
+    extract_forecast_timestamp,
+    extract_timestamp,
+    overlay_filename,
+    timestamp_stub,
+)
+from .png_pipeline import generate_pngs, generate_pngs_batch, generate_pngs_extended_batch, shutdown_pool
 
 LOGGER = logging.getLogger(__name__)
 
+_LISTING_SETTLE_NS = 1_000_000_000
+_MIN_SLEEP = 0.05  # seconds
+_EXTENDED_RECHECK_CYCLES = 12
+# ``png_renderer._atomic_write`` temp files; older than this means the writer died
+_STALE_TEMP_PATTERN = ".*.tmp"
+_STALE_TEMP_SECONDS = 3600
+
+
+def _unlink(path: Path) -> None:
+    """Remove a pruned file; already gone (e.g. pruned concurrently) is fine."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
 
 class RadarScheduler:
     def __init__(self) -> None:
@@ -25,25 +52,32 @@ class RadarScheduler:
         self.quick_attempts: int = 0
         self.quick_last_attempt: datetime | None = None
         self.next_publish: datetime = self._calculate_next_expected()
+        self._cycles = 0
+        self._cycle_entries: list[str] | None = None
+        self._rendered_backlog = False  # radar overlays rendered this cycle
+        # (directory, pattern) -> (directory mtime_ns, sorted matches)
+        self._listings: dict[tuple[Path, str], tuple[int, list[Path]]] = {}
+        # Network side jobs (forecast TAR download); threads start on first submit
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler-io")
 
     def _calculate_next_expected(self, reference: datetime | None = None) -> datetime:
         now = reference or datetime.utcnow()
-        minute_bucket = (now.minute // 5 + 1) * 5
-        if minute_bucket >= 60:
-            next_time = (now.replace(second=0, microsecond=0) + timedelta(hours=1)).replace(minute=0)
-        else:
-            next_time = now.replace(minute=minute_bucket, second=0, microsecond=0)
+        # Strictly after ``now``; the timedelta carries hour and day rollover
+        next_time = now.replace(second=0, microsecond=0) + timedelta(minutes=5 - now.minute % 5)
         LOGGER.debug("Next expected publish at %s", next_time)
         return next_time
 
     def _radar_entries(self) -> list[str]:
-        entries = list_remote_files(self.config.sources.radar_base_url)
-        return iter_latest(entries, self.config.storage.min_tracked_files)
+        """Remote radar listing, fetched at most once per ``run_cycle``."""
+        if self._cycle_entries is None:
+            self._cycle_entries = list_remote_files(
+                self.config.sources.radar_base_url, limit=self.config.storage.min_tracked_files
+            )
+        return self._cycle_entries
 
-    def _overlay_exists(self, ts: datetime) -> bool:
-        """Check if overlay PNG exists for the given timestamp."""
-        overlay = self.config.storage.radar_output_dir / f"radar_{ts.strftime('%Y%m%d_%H%M')}_overlay.png"
-        return overlay.exists()
+    def _names(self, directory: Path) -> set[str]:
+        """Snapshot of entry names in ``directory``: one listing instead of a stat per file."""
+        return {path.name for path in self._listing(directory, "*")}
 
     def _ensure_radar_backlog(self) -> tuple[bool, datetime | None, bool]:
         entries = self._radar_entries()
@@ -51,74 +85,103 @@ class RadarScheduler:
             LOGGER.warning("No radar entries found")
             return False, None, False
 
-        latest_timestamp = extract_timestamp(entries[0]) if entries else None
-        processed_any = False
+        latest_timestamp = extract_timestamp(entries[0])
         latest_overlay_exists = False
-
-        # Collect files to process in batches
-        files_to_process = []
+        local_names = self._names(self.config.storage.radar_data_dir)
+        overlay_names = self._names(self.config.storage.radar_output_dir)
+
+        # (overlay filename, local HDF path), oldest first
+        candidates: list[tuple[str, Path]] = []
+        missing: list[Path] = []
+        entry_timestamps: dict[str, datetime] = {}
+        data_dir = self.config.storage.radar_data_dir
         for filename in reversed(entries):
             ts = extract_timestamp(filename)
             if not ts:
                 LOGGER.debug("Skipping unrecognized radar filename %s", filename)
                 continue
-
-            local_path = self.config.storage.radar_data_dir / filename
-            if not local_path.exists():
-                downloaded = download_file(self.config.sources.radar_base_url, filename, local_path)
-                if not downloaded:
-                    continue
-                processed_any = True
-
-            overlay_path = self.config.storage.radar_output_dir / f"radar_{ts.strftime('%Y%m%d_%H%M')}_overlay.png"
-            if not overlay_path.exists():
-                files_to_process.append(local_path)
+            entry_timestamps[filename] = ts
+
+            local_path = data_dir / filename
+            if filename not in local_names:
+                missing.append(local_path)
+            candidates.append((overlay_filename(ts, "overlay"), local_path))
+
+        # Render files already on disk straight away and feed each missing
+        # file to the render pool as soon as its download lands, so network
+        # and CPU work overlap instead of running back to back.
+        missing_set = set(missing)
+        failed: set[Path] = set()
+        render_pending = [
+            local_path
+            for overlay_name, local_path in candidates
+            if local_path not in missing_set and overlay_name not in overlay_names
+        ]
+        overlay_for = {local_path: overlay_name for overlay_name, local_path in candidates}
+
+        def files_to_process() -> Iterator[Path]:
+            yield from render_pending
+            for local_path, result in iter_downloads(
+                self.config.sources.radar_base_url,
+                [path.name for path in missing],
+                missing,
+            ):
+                if result is None:
+                    failed.add(local_path)
+                elif overlay_for[local_path] not in overlay_names:
+                    yield local_path
 
         # Process files in parallel batches if any need processing
-        if files_to_process:
-            LOGGER.info("Processing %d radar files in parallel", len(files_to_process))
-            self._process_radar_batch(files_to_process)
-            processed_any = True
-
-        # Update processed radar map
-        for filename in entries:
-            ts = extract_timestamp(filename)
-            if ts:
-                self.processed_radar[filename] = ts
-
-                if latest_timestamp and ts == latest_timestamp:
-                    overlay_path = self.config.storage.radar_output_dir / f"radar_{ts.strftime('%Y%m%d_%H%M')}_overlay.png"
-                    latest_overlay_exists = overlay_path.exists()
+        expected = len(render_pending) + len(missing)
+        if expected:
+            LOGGER.info("Processing up to %d radar files in parallel", expected)
+            if self._process_radar_batch(files_to_process(), expected):
+                self._rendered_backlog = True
+        # Only a successful download means new radar data arrived; re-rendering
+        # files already on disk must not end quick mode.
+        processed_any = len(failed) < len(missing)
+
+        # Update processed radar map (timestamps parsed once, above)
+        self.processed_radar.update(entry_timestamps)
+        if latest_timestamp:
+            overlay_names = self._names(self.config.storage.radar_output_dir)  # the batch added overlays
+            latest_overlay_exists = overlay_filename(latest_timestamp, "overlay") in overlay_names
 
         # Keep processed map constrained to tracked files. Any missing image
         # within the window is regenerated immediately, so historical data stays
         # complete even if the process restarts mid-day.
-        self.processed_radar = {fname: ts for fname, ts in self.processed_radar.items() if fname in entries}
+        tracked = set(entries)
+        for fname in self.processed_radar.keys() - tracked:
+            del self.processed_radar[fname]
         self._prune_radar_outputs()
 
         return processed_any, latest_timestamp, latest_overlay_exists
 
-    def _process_radar_batch(self, hdf_paths: list[Path]) -> list[datetime]:
-        """Process multiple radar files in parallel."""
-        if not hdf_paths:
+    def _process_radar_batch(self, hdf_paths: Iterable[Path], task_count: int | None = None) -> list[datetime]:
+        """Process multiple radar files in parallel.
+
+        ``hdf_paths`` may be lazy; pass ``task_count`` (the expected number of
+        files) so rendering can start before the iterable is exhausted.
+        """
+        if task_count is None:
+            hdf_paths = list(hdf_paths)
+            task_count = len(hdf_paths)
+        if not task_count:
             return []
 
         # Use batch processing for multiple files
-        results = generate_pngs_batch(hdf_paths)
+        results = generate_pngs_batch(hdf_paths, task_count=task_count)
 
         timestamps = []
-        for hdf_path in hdf_paths:
-            if hdf_path in results:
-                pngs = results[hdf_path]
-                timestamp = extract_timestamp(hdf_path.name)
-                if not timestamp:
-                    raise RuntimeError(f"Unable to parse timestamp from {hdf_path.name}")
-                stub = timestamp.strftime("%Y%m%d%H%M")
-                self.processed_radar[hdf_path.name] = timestamp
-                timestamps.append(timestamp)
-                LOGGER.info("Radar %s processed into %d files", stub, len(pngs))
-            else:
-                LOGGER.warning("No results for %s", hdf_path.name)
+        for hdf_path in sorted(results):
+            pngs = results[hdf_path]
+            timestamp = extract_timestamp(hdf_path.name)
+            if not timestamp:
+                raise RuntimeError(f"Unable to parse timestamp from {hdf_path.name}")
+            stub = timestamp.strftime("%Y%m%d%H%M")
+            self.processed_radar[hdf_path.name] = timestamp
+            timestamps.append(timestamp)
+            LOGGER.info("Radar %s processed into %d files", stub, len(pngs))
 
         return timestamps
 
@@ -128,30 +191,27 @@ class RadarScheduler:
         if not entries:
             return False
 
+        local_names = self._names(self.config.storage.radar_data_dir)
+        overlay_names = self._names(self.config.storage.radar_output_dir)
+        extended_names = self._names(self.config.storage.extended_output_dir)
+
         files_to_process: list[Path] = []
         for filename in reversed(entries):
             ts = extract_timestamp(filename)
             if not ts:
                 continue
 
-            standard_overlay = self.config.storage.radar_output_dir / f"radar_{ts.strftime('%Y%m%d_%H%M')}_overlay.png"
-            if not standard_overlay.exists():
+            stub = "radar_" + timestamp_stub(ts)
+            if stub + "_overlay.png" not in overlay_names:
                 continue
 
-            extended_overlay = (
-                self.config.storage.extended_output_dir / f"radar_{ts.strftime('%Y%m%d_%H%M')}_overlay_extended.png"
-            )
-            extended_overlay2x = (
-                self.config.storage.extended_output_dir / f"radar_{ts.strftime('%Y%m%d_%H%M')}_overlay2x_extended.png"
-            )
-            if extended_overlay.exists() and extended_overlay2x.exists():
+            if stub + "_overlay_extended.png" in extended_names and stub + "_overlay2x_extended.png" in extended_names:
                 continue
 
-            local_path = self.config.storage.radar_data_dir / filename
-            if not local_path.exists():
+            if filename not in local_names:
                 continue
 
-            files_to_process.append(local_path)
+            files_to_process.append(self.config.storage.radar_data_dir / filename)
 
         if files_to_process:
             LOGGER.info("Processing %d extended radar files in parallel", len(files_to_process))
@@ -172,7 +232,7 @@ class RadarScheduler:
         return timestamp
 
     def _download_forecast_tar(self) -> Path | None:
-        entries = list_remote_files(self.config.sources.forecast_base_url)
+        entries = list_remote_files(self.config.sources.forecast_base_url, limit=1)
         if not entries:
             LOGGER.debug("No forecast archives available")
             return None
@@ -188,6 +248,8 @@ class RadarScheduler:
     def _process_forecast(self, radar_timestamp: datetime, tar_path: Path) -> None:
         extracted = extract_forecast_tar(tar_path, self.config.storage.forecast_data_dir)
         candidates: list[tuple[int, Path]] = []
+        output_names = self._names(self.config.storage.forecast_output_dir)
+        forecast_stub = "radar_" + timestamp_stub(radar_timestamp)  # same for every file in the bundle
 
         for hdf_file in extracted:
             ts = extract_timestamp(hdf_file.name)
@@ -195,15 +257,11 @@ class RadarScheduler:
                 LOGGER.debug("Skipping forecast %s (missing timestamp)", hdf_file.name)
                 continue
 
-            offset_match = hdf_file.stem.rsplit("_ft", maxsplit=1)
-            if len(offset_match) != 2:
+            offset_match = FORECAST_OFFSET_PATTERN.search(hdf_file.stem)
+            if not offset_match:
                 LOGGER.warning("Cannot derive forecast offset from %s", hdf_file.name)
                 continue
-            try:
-                label_offset = int(offset_match[1])
-            except ValueError:
-                LOGGER.warning("Invalid forecast offset in %s", hdf_file.name)
-                continue
+            label_offset = int(offset_match.group(1))
 
             delta_minutes = int(round((ts - radar_timestamp).total_seconds() / 60))
             if delta_minutes < 0:
@@ -226,10 +284,8 @@ class RadarScheduler:
 
             # Skip only if both variants already exist.
             # Use radar_timestamp (forecast generation time) since that's what the PNG filename uses.
-            overlay_stub = f"radar_{radar_timestamp.strftime('%Y%m%d_%H%M')}_forecast_fct{final_offset:02d}"
-            overlay_path = self.config.storage.forecast_output_dir / f"{overlay_stub}_overlay.png"
-            overlay2x_path = self.config.storage.forecast_output_dir / f"{overlay_stub}_overlay2x.png"
-            if overlay_path.exists() and overlay2x_path.exists():
+            overlay_stub = f"{forecast_stub}_forecast_fct{final_offset:02d}"
+            if f"{overlay_stub}_overlay.png" in output_names and f"{overlay_stub}_overlay2x.png" in output_names:
                 LOGGER.debug("Forecast overlays already exist for offset %d, skipping", final_offset)
                 continue
 
@@ -249,85 +305,155 @@ class RadarScheduler:
         LOGGER.info("Forecast bundle %s processed", tar_path.name)
         self._prune_forecast_outputs()
 
+    def _listing(self, directory: Path, pattern: str) -> list[Path]:
+        """Sorted entries of ``directory`` matching ``pattern``.
+
+        Cached on the directory's mtime, which changes whenever an entry is
+        added, removed or renamed, so steady-state pruning costs one stat.
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        key = (directory, pattern)
+        cached = self._listings.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with os.scandir(directory) as it:
+            matches = sorted(directory / entry.name for entry in it if fnmatch.fnmatchcase(entry.name, pattern))
+        # A just-modified directory could change again within the same mtime
+        # tick without its mtime moving; only trust settled timestamps.
+        if time.time_ns() - mtime_ns > _LISTING_SETTLE_NS:
+            self._listings[key] = (mtime_ns, matches)
+        else:
+            self._listings.pop(key, None)
+        return matches
+
+    @staticmethod
+    def _walk(directory: Path) -> tuple[list[Path], list[Path]]:
+        """Recursively collect (files, subdirectories) below ``directory`` with scandir."""
+        files: list[Path] = []
+        dirs: list[Path] = []
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(Path(entry.path))
+                            pending.append(Path(entry.path))
+                        else:
+                            files.append(Path(entry.path))
+            except FileNotFoundError:
+                continue
+        return files, dirs
+
+    def _sweep_stale_temps(self, directory: Path) -> None:
+        """Remove temp files left behind by a worker killed mid-write."""
+        cutoff = time.time() - _STALE_TEMP_SECONDS
+        for path in self._listing(directory, _STALE_TEMP_PATTERN):
+            with contextlib.suppress(FileNotFoundError):
+                if path.stat().st_mtime < cutoff:
+                    _unlink(path)
+
     def _prune_forecast_outputs(self) -> None:
+        self._sweep_stale_temps(self.config.storage.forecast_output_dir)
         limit = self.config.storage.max_forecast_files
         if limit <= 0:
             return
-        outputs = sorted(self.config.storage.forecast_output_dir.glob("radar_*_forecast*.png"))
+        outputs = self._listing(self.config.storage.forecast_output_dir, "radar_*_forecast*.png")
         for path in outputs[:-limit]:
-            path.unlink(missing_ok=True)
-        archives = sorted(self.config.storage.forecast_data_dir.rglob("*.hdf"))
+            _unlink(path)
+        files, directories = self._walk(self.config.storage.forecast_data_dir)
+        archives = sorted(path for path in files if path.suffix == ".hdf")
         for path in archives[:-limit]:
-            path.unlink(missing_ok=True)
-        tarballs = sorted(self.config.storage.forecast_data_dir.rglob("*.tar"))
+            _unlink(path)
+        tarballs = sorted(path for path in files if path.suffix == ".tar")
         for path in tarballs[:-limit]:
-            path.unlink(missing_ok=True)
-        for directory in sorted(self.config.storage.forecast_data_dir.glob("**/*"), reverse=True):
-            if directory.is_dir() and not any(directory.iterdir()):
-                directory.rmdir()
+            _unlink(path)
+        # Deepest first, so parents emptied by removing a child are removed too
+        for directory in sorted(directories, reverse=True):
+            with contextlib.suppress(OSError):
+                directory.rmdir()  # only succeeds when empty
+
+    def _retention_cutoff(self, limit: int) -> str | None:
+        """Oldest ``YYYYMMDD_HHMM`` stub still retained, or None while under the limit.
+
+        Stubs are zero-padded timestamps, so they compare in time order as strings.
+        """
+        overlays = self._listing(self.config.storage.radar_output_dir, "radar_*_overlay.png")
+        if len(overlays) <= limit:
+            return None
+        match = OVERLAY_STUB_PATTERN.match(overlays[-limit].name)
+        return match.group(1) if match else None
+
+    def _prune_older_than(self, cutoff: str | None, overlays: list[Path]) -> None:
+        if cutoff is None:
+            return
+        for overlay in overlays:
+            match = OVERLAY_STUB_PATTERN.match(overlay.name)
+            if match and match.group(1) < cutoff:
+                _unlink(overlay)
 
     def _prune_radar_outputs(self) -> None:
+        self._sweep_stale_temps(self.config.storage.radar_output_dir)
         limit = self.config.storage.max_tracked_files
         if limit <= 0:
             return
-        # Use overlay files to determine which timestamps to keep
-        overlays = sorted(self.config.storage.radar_output_dir.glob("radar_*_overlay.png"))
-        keep_overlays = overlays[-limit:]
-        keep_stubs = {
-            f"{ov.stem.split('_')[1]}_{ov.stem.split('_')[2]}" for ov in keep_overlays if len(ov.stem.split('_')) >= 3
-        }
-        # Remove old overlay variants that are no longer in the retention window
-        all_overlays = sorted(self.config.storage.radar_output_dir.glob("radar_*.png"))
-        for overlay in all_overlays:
-            parts = overlay.stem.split("_")
-            if len(parts) >= 3 and f"{parts[1]}_{parts[2]}" not in keep_stubs:
-                overlay.unlink(missing_ok=True)
+        # Remove overlay variants older than the newest ``limit`` standard overlays
+        cutoff = self._retention_cutoff(limit)
+        self._prune_older_than(cutoff, self._listing(self.config.storage.radar_output_dir, "radar_*.png"))
         # Clean up legacy background files if any exist
-        old_backgrounds = sorted(self.config.storage.radar_output_dir.glob("background_radar_*.png"))
+        old_backgrounds = self._listing(self.config.storage.radar_output_dir, "background_radar_*.png")
         for path in old_backgrounds:
-            path.unlink(missing_ok=True)
-        archives = sorted(self.config.storage.radar_data_dir.glob("*.hdf"))
+            _unlink(path)
+        archives = self._listing(self.config.storage.radar_data_dir, "*.hdf")
         for path in archives[:-limit]:
-            path.unlink(missing_ok=True)
+            _unlink(path)
 
     def _prune_extended_outputs(self) -> None:
+        self._sweep_stale_temps(self.config.storage.extended_output_dir)
         limit = self.config.storage.max_tracked_files
         if limit <= 0:
             return
         # Use standard overlay files to determine which timestamps to keep
-        overlays = sorted(self.config.storage.radar_output_dir.glob("radar_*_overlay.png"))
-        keep_overlays = overlays[-limit:]
-        keep_stubs = {
-            f"{ov.stem.split('_')[1]}_{ov.stem.split('_')[2]}" for ov in keep_overlays if len(ov.stem.split('_')) >= 3
-        }
-        all_overlays = sorted(self.config.storage.extended_output_dir.glob("radar_*.png"))
-        for overlay in all_overlays:
-            parts = overlay.stem.split("_")
-            if len(parts) >= 3 and f"{parts[1]}_{parts[2]}" not in keep_stubs:
-                overlay.unlink(missing_ok=True)
+        cutoff = self._retention_cutoff(limit)
+        self._prune_older_than(cutoff, self._listing(self.config.storage.extended_output_dir, "radar_*.png"))
 
     def run_cycle(self) -> bool:
+        self._cycle_entries = None  # radar and extended backlogs share one listing
+        self._rendered_backlog = False
+        # A forecast is only usable alongside a radar timestamp. When the
+        # listing has one, fetch the TAR in the background while radar files render.
+        entries = self._radar_entries()
+        tar_future: Future[Path | None] | None = None
+        if entries and extract_timestamp(entries[0]):
+            tar_future = self._executor.submit(self._download_forecast_tar)
         processed_new, latest_timestamp, latest_ready = self._ensure_radar_backlog()
+        tar_path = tar_future.result() if tar_future is not None else None
 
         # Process forecast if we have new radar data, regardless of whether the latest overlay is ready
         # The forecast processing will handle the timestamp matching internally
-        if latest_timestamp:
-            tar_path = self._download_forecast_tar()
-            if tar_path:
-                # Extract timestamp from forecast TAR filename - this is the source of truth for offsets
-                # We MUST use the forecast generation timestamp, not the radar timestamp, because:
-                # 1. Forecast files contain future timestamps based on when the forecast was generated
-                # 2. If radar fetching fails/delays, using radar timestamp would create wrong offsets
-                # 3. The forecast TAR filename timestamp is the correct reference point for offset calculations
-                forecast_timestamp = extract_forecast_timestamp(tar_path.name)
-                if forecast_timestamp:
-                    self._process_forecast(forecast_timestamp, tar_path)
-                    LOGGER.info("Processing forecast using generation timestamp: %s", forecast_timestamp)
-                else:
-                    LOGGER.warning("Could not extract timestamp from forecast TAR: %s", tar_path.name)
-
-        # Extended overlays are low priority and run after standard + forecast processing.
-        self._ensure_extended_backlog()
+        if latest_timestamp and tar_path:
+            # Extract timestamp from forecast TAR filename - this is the source of truth for offsets
+            # We MUST use the forecast generation timestamp, not the radar timestamp, because:
+            # 1. Forecast files contain future timestamps based on when the forecast was generated
+            # 2. If radar fetching fails/delays, using radar timestamp would create wrong offsets
+            # 3. The forecast TAR filename timestamp is the correct reference point for offset calculations
+            forecast_timestamp = extract_forecast_timestamp(tar_path.name)
+            if forecast_timestamp:
+                self._process_forecast(forecast_timestamp, tar_path)
+                LOGGER.info("Processing forecast using generation timestamp: %s", forecast_timestamp)
+            else:
+                LOGGER.warning("Could not extract timestamp from forecast TAR: %s", tar_path.name)
+
+        # Extended overlays are low priority and run after standard + forecast
+        # processing. Idle quick-mode retries skip the scan; every Nth cycle
+        # (including the first) still runs it to recover missed frames.
+        if processed_new or self._rendered_backlog or self._cycles % _EXTENDED_RECHECK_CYCLES == 0:
+            self._ensure_extended_backlog()
+        self._cycles += 1
 
         if latest_ready and latest_timestamp:
             self.next_publish = self._calculate_next_expected(latest_timestamp)
@@ -337,8 +463,8 @@ class RadarScheduler:
     def step(self, now: datetime) -> None:
         """Advance scheduler state by a single timestep.
 
-        The loop ticks every second. As soon as the wall clock crosses the
-        next five-minute boundary we flip into "quick" mode: an immediate fetch
+        The loop wakes only when work is due. As soon as the wall clock crosses
+        the next five-minute boundary we flip into "quick" mode: an immediate fetch
         attempt runs, followed by retries every ``quick_check_interval`` seconds
         until we either observe new radar data or exhaust the configured limit.
         Leaving quick mode updates ``next_publish`` so the next boundary is
@@ -386,12 +512,32 @@ class RadarScheduler:
             if processed:
                 self.next_publish = self._calculate_next_expected(now)
 
+    def _next_wake(self) -> datetime:
+        """Wall-clock time at which ``step`` next has work to do."""
+        if not self.quick_mode:
+            return self.next_publish
+        if self.quick_last_attempt is None:
+            return datetime.utcnow()
+        return self.quick_last_attempt + timedelta(seconds=self.config.timing.quick_check_interval)
+
     def run_forever(self) -> None:
         LOGGER.info("Starting scheduler loop")
 
-        while True:
-            now = datetime.utcnow()
-            self.step(now)
-            time.sleep(1)
+        try:
+            while True:
+                now = datetime.utcnow()
+                self.step(now)
+                # Sleep straight to the next boundary or quick retry instead of
+                # ticking every second. Capped at one publish interval so a wall
+                # clock jump cannot stall the loop for longer than that.
+                delay = (self._next_wake() - datetime.utcnow()).total_seconds()
+                time.sleep(min(max(delay, _MIN_SLEEP), self.config.timing.publish_interval))
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release background workers; safe to call more than once."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        shutdown_pool()
 
 
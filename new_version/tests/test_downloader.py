@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+import pytest
+
 from new_version import downloader
 
 
@@ -15,9 +17,9 @@ def test_list_remote_files_includes_tar(monkeypatch):
     </html>
     """
 
-    dummy_response = SimpleNamespace(text=html_listing)
+    dummy_response = SimpleNamespace(content=html_listing.encode("ascii"), status_code=200, headers={})
 
-    def fake_request(url: str, stream: bool = False):  # noqa: ARG001
+    def fake_request(url: str, stream: bool = False, headers=None):  # noqa: ARG001
         return dummy_response
 
     monkeypatch.setattr(downloader, "_request_with_retry", fake_request)
@@ -25,5 +27,40 @@ def test_list_remote_files_includes_tar(monkeypatch):
     entries = downloader.list_remote_files("https://example.test/")
 
     assert entries == ["z_forecast.tar", "y_radar.hdf", "a_old.hdf"]
+    assert downloader.list_remote_files("https://example.test/", limit=2) == ["z_forecast.tar", "y_radar.hdf"]
+
+
+def test_iter_downloads_reports_each_destination(monkeypatch, tmp_path):
+    def fake_download(base_url: str, filename: str, destination):  # noqa: ARG001
+        return None if filename == "b.hdf" else destination
+
+    monkeypatch.setattr(downloader, "download_file", fake_download)
+
+    filenames = ["a.hdf", "b.hdf", "c.hdf"]
+    destinations = [tmp_path / name for name in filenames]
+
+    results = dict(downloader.iter_downloads("https://example.test/", filenames, destinations, workers=2))
+
+    assert results == {destinations[0]: destinations[0], destinations[1]: None, destinations[2]: destinations[2]}
 
 
+def test_iter_downloads_rejects_mismatched_destinations(tmp_path):
+    with pytest.raises(ValueError):
+        list(downloader.iter_downloads("https://example.test/", ["a.hdf"], []))
+
+
+def test_list_remote_files_revalidates_cached_listing(monkeypatch):
+    listing = SimpleNamespace(content=b'<a href="a.hdf">a</a>', status_code=200, headers={"ETag": '"v1"'})
+    not_modified = SimpleNamespace(content=b"", status_code=304, headers={})
+    sent_headers = []
+
+    def fake_request(url: str, stream: bool = False, headers=None):  # noqa: ARG001
+        sent_headers.append(headers)
+        return listing if headers is None else not_modified
+
+    monkeypatch.setattr(downloader, "_request_with_retry", fake_request)
+    monkeypatch.setattr(downloader, "_LISTINGS", {})
+
+    assert downloader.list_remote_files("https://example.test/") == ["a.hdf"]
+    assert downloader.list_remote_files("https://example.test/") == ["a.hdf"]
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import h5py
+import numpy as np
+
+from new_version.hdf_reader import load_radar_hdf
+
+
+def _write_hdf(path, raw, gain=0.5, offset=-32.0, nodata=255, undetect=0):
+    with h5py.File(path, "w") as hdf:
+        hdf.create_group("what").attrs.update({"date": b"20250926", "time": b"202000"})
+        hdf.create_group("where").attrs.update(
+            {
+                "LL_lon": 12.0,
+                "UR_lon": 19.0,
+                "LL_lat": 48.0,
+                "UR_lat": 51.5,
+                "xsize": raw.shape[1],
+                "ysize": raw.shape[0],
+            }
+        )
+        data_group = hdf.create_group("dataset1/data1")
+        data_group.create_dataset("data", data=raw)
+        data_group.create_group("what").attrs.update(
+            {"gain": gain, "offset": offset, "nodata": nodata, "undetect": undetect}
+        )
+
+
+def test_load_radar_hdf_converts_values_and_sentinels(tmp_path):
+    raw = np.array([[0, 100, 255], [72, 200, 0]], dtype=np.uint8)
+    path = tmp_path / "radar.hdf"
+    _write_hdf(path, raw)
+
+    product = load_radar_hdf(path)
+
+    assert product.data.dtype == np.float32
+    assert product.metadata.timestamp == datetime(2025, 9, 26, 20, 20)
+    assert product.metadata.grid_shape == (2, 3)
+    assert product.metadata.bounds == (12.0, 19.0, 48.0, 51.5)
+    expected = np.array([[-32.0, 18.0, np.nan], [4.0, 68.0, -32.0]], dtype=np.float32)
+    np.testing.assert_array_equal(product.data, expected)
+
+
+def test_load_radar_hdf_handles_uint16_counts(tmp_path):
+    raw = np.array([[0, 1000], [65535, 72]], dtype=np.uint16)
+    path = tmp_path / "radar16.hdf"
+    _write_hdf(path, raw, gain=0.01, offset=-32.0, nodata=65535, undetect=0)
+
+    product = load_radar_hdf(path)
+
+    expected = np.array([[-32.0, -22.0], [np.nan, -31.28]], dtype=np.float32)
+    np.testing.assert_allclose(product.data, expected, rtol=1e-6)
+
+
+def test_load_radar_hdf_reads_dataset_shape_not_where_attrs(tmp_path):
+    raw = np.array([[0, 100, 255], [72, 200, 0]], dtype=np.uint8)
+    path = tmp_path / "radar.hdf"
+    _write_hdf(path, raw)
+    with h5py.File(path, "a") as hdf:
+        hdf["where"].attrs["xsize"] = 4  # disagrees with the stored grid
+
+    product = load_radar_hdf(path)
+
+    assert product.data.shape == (2, 3)
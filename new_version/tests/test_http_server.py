@@ -0,0 +1,52 @@
+import http.server
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from new_version.http_server import RadarStaticRequestHandler
+
+
+@pytest.fixture
+def served(monkeypatch, tmp_path):
+    monkeypatch.setattr(RadarStaticRequestHandler, "MOUNT_POINTS", {"output": tmp_path})
+    monkeypatch.setattr(RadarStaticRequestHandler, "log_message", lambda *args: None)
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RadarStaticRequestHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield tmp_path, f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_png_responses_are_cacheable_only_when_found(served):
+    root, base_url = served
+    (root / "radar_20240101_1200_overlay.png").write_bytes(b"png")
+
+    with urllib.request.urlopen(f"{base_url}/output/radar_20240101_1200_overlay.png") as response:
+        assert response.read() == b"png"
+        assert response.headers["Cache-Control"] == "public, max-age=60"
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        urllib.request.urlopen(f"{base_url}/output/radar_20240101_1205_overlay.png")
+    assert excinfo.value.code == 404
+    assert excinfo.value.headers["Cache-Control"] is None
+
+
+def test_directory_listing_escapes_and_sorts_entries(served):
+    root, base_url = served
+    (root / "b <new>.png").write_bytes(b"")
+    (root / "A.png").write_bytes(b"")
+    (root / "sub").mkdir()
+
+    with urllib.request.urlopen(f"{base_url}/output/") as response:
+        body = response.read().decode("utf-8")
+        assert response.headers["Content-Type"] == "text/html; charset=utf-8"
+        assert "Cache-Control" not in response.headers
+
+    assert body.index("A.png") < body.index("b &lt;new&gt;.png") < body.index("sub/")
+    assert '<a href="b%20%3Cnew%3E.png">' in body
+    assert '<a href="sub/">sub/</a>' in body
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from new_version.naming import overlay_filename, extract_forecast_timestamp
+from new_version.naming import overlay_filename, extract_forecast_timestamp, extract_timestamp
 
 
 def test_overlay_filename():
@@ -34,3 +34,6 @@ def test_extract_forecast_timestamp():
     assert result is None
 
 
+def test_extract_timestamp():
+    assert extract_timestamp("T_PABV23_C_OKPR_20250926202000.hdf") == datetime(2025, 9, 26, 20, 20)
+    assert extract_timestamp("no_timestamp.hdf") is None
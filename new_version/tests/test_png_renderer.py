@@ -0,0 +1,43 @@
+import numpy as np
+from PIL import Image
+
+from new_version.hdf_reader import RadarProduct
+from new_version.png_renderer import (
+    COLOR_BOUNDS,
+    COLOR_LUT,
+    EXTENDED_COLOR_BOUNDS,
+    OVERLAY_VARIANTS,
+    _color_indices,
+    render_overlays,
+)
+
+
+def test_color_indices_follow_4dbz_steps():
+    data = np.array([[np.nan, -32.0, 3.9, 4.0], [7.9, 8.0, 63.9, 80.0]], dtype=np.float32)
+
+    indices = _color_indices(data, COLOR_BOUNDS)
+
+    transparent = len(COLOR_LUT) - 1
+    assert indices.tolist() == [[transparent, transparent, transparent, 0], [0, 1, 14, 14]]
+    assert COLOR_LUT[transparent, 3] == 0
+
+
+def test_extended_color_indices_start_at_minus_12():
+    data = np.array([-32.0, -12.0, 0.0, 4.0], dtype=np.float32)
+
+    indices = _color_indices(data, EXTENDED_COLOR_BOUNDS)
+
+    assert indices.tolist() == [19, 0, 3, 4]
+
+
+def test_no_echo_frame_writes_transparent_overlays(tmp_path):
+    product = RadarProduct(data=np.full((3, 5), np.nan, dtype=np.float32), metadata=None)
+    product.data[0, 0] = 3.9
+    targets = {name: tmp_path / f"{name}.png" for name in OVERLAY_VARIANTS}
+
+    render_overlays(product, targets)
+
+    for name, scale in OVERLAY_VARIANTS.items():
+        with Image.open(targets[name]) as image:
+            assert image.size == (5 * scale, 3 * scale)
+            assert image.convert("RGBA").getextrema()[3] == (0, 0)
@@ -1,3 +1,5 @@
+import os
+from dataclasses import replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from types import MethodType
@@ -86,15 +88,191 @@ def test_run_cycle_updates_next_publish_when_latest_ready():
     def fake_ensure(self):
         return False, base_timestamp, True
 
+    tar_path = Path("T_PABV23_C_OKPR_20250926.2020.ft60s10.tar")
+    scheduler._radar_entries = MethodType(lambda self: ["T_PABV23_C_OKPR_20250926202000.hdf"], scheduler)
     scheduler._ensure_radar_backlog = MethodType(fake_ensure, scheduler)
-    scheduler._download_forecast_tar = MethodType(lambda self: None, scheduler)
-    scheduler._process_forecast = MethodType(lambda self, ts, path: None, scheduler)
+    scheduler._download_forecast_tar = MethodType(lambda self: tar_path, scheduler)
+    process_forecast = Mock()
+    scheduler._process_forecast = process_forecast
+    scheduler._ensure_extended_backlog = Mock()
 
     scheduler.next_publish = datetime(2025, 9, 26, 20, 15)
     scheduler.run_cycle()
 
     expected_next = scheduler._calculate_next_expected(base_timestamp)
     assert scheduler.next_publish == expected_next
+    process_forecast.assert_called_once_with(datetime(2025, 9, 26, 20, 20), tar_path)
+
+
+def test_listing_is_cached_until_directory_changes(tmp_path):
+    scheduler = make_scheduler()
+    (tmp_path / "radar_20250926_2000_overlay.png").touch()
+    (tmp_path / "other.png").touch()
+    settled = 1_000_000_000_000_000_000
+    os.utime(tmp_path, ns=(settled, settled))
+
+    first = scheduler._listing(tmp_path, "radar_*.png")
+    assert [path.name for path in first] == ["radar_20250926_2000_overlay.png"]
+
+    with patch("new_version.scheduler.os.scandir", side_effect=AssertionError("rescanned")):
+        assert scheduler._listing(tmp_path, "radar_*.png") is first
+
+    (tmp_path / "radar_20250926_2005_overlay.png").touch()
+    assert [path.name for path in scheduler._listing(tmp_path, "radar_*.png")] == [
+        "radar_20250926_2000_overlay.png",
+        "radar_20250926_2005_overlay.png",
+    ]
+
+
+def test_next_wake_tracks_boundary_and_quick_retries():
+    scheduler = make_scheduler()
+    boundary = datetime(2025, 9, 26, 20, 0)
+    scheduler.next_publish = boundary
+
+    assert scheduler._next_wake() == boundary
+
+    scheduler.step(boundary)
+
+    assert scheduler._next_wake() == boundary + timedelta(seconds=scheduler.config.timing.quick_check_interval)
+
+
+def test_radar_backlog_renders_downloads_as_they_land(monkeypatch, tmp_path):
+    scheduler = make_scheduler()
+    storage = replace(scheduler.config.storage, radar_data_dir=tmp_path / "data", radar_output_dir=tmp_path / "out")
+    scheduler.config = replace(scheduler.config, storage=storage)
+    storage.radar_data_dir.mkdir()
+    on_disk = "T_PABV23_C_OKPR_20250926200000.hdf"
+    (storage.radar_data_dir / on_disk).touch()
+    entries = ["T_PABV23_C_OKPR_20250926201000.hdf", "T_PABV23_C_OKPR_20250926200500.hdf", on_disk]
+    scheduler._radar_entries = MethodType(lambda self: entries, scheduler)
+
+    def fake_downloads(base_url, filenames, destinations):  # noqa: ARG001
+        for destination in destinations:
+            yield destination, None if destination.name == entries[1] else destination
+
+    rendered = []
+
+    def fake_batch(hdf_paths, task_count):
+        assert task_count == 3
+        for path in hdf_paths:
+            rendered.append(path.name)
+        return {storage.radar_data_dir / name: {} for name in rendered}
+
+    monkeypatch.setattr("new_version.scheduler.iter_downloads", fake_downloads)
+    monkeypatch.setattr("new_version.scheduler.generate_pngs_batch", fake_batch)
+
+    processed_any, latest, _ = scheduler._ensure_radar_backlog()
+
+    assert processed_any is True
+    assert latest == datetime(2025, 9, 26, 20, 10)
+    assert rendered == [on_disk, entries[0]]
+
+
+def test_radar_backlog_rerender_alone_is_not_new_data(monkeypatch, tmp_path):
+    scheduler = make_scheduler()
+    storage = replace(scheduler.config.storage, radar_data_dir=tmp_path / "data", radar_output_dir=tmp_path / "out")
+    scheduler.config = replace(scheduler.config, storage=storage)
+    storage.radar_data_dir.mkdir()
+    on_disk = "T_PABV23_C_OKPR_20250926200000.hdf"
+    (storage.radar_data_dir / on_disk).touch()
+    scheduler._radar_entries = MethodType(lambda self: [on_disk], scheduler)
 
+    monkeypatch.setattr("new_version.scheduler.iter_downloads", lambda *args: iter(()))
+    monkeypatch.setattr(
+        "new_version.scheduler.generate_pngs_batch",
+        lambda hdf_paths, task_count: {path: {} for path in hdf_paths},  # noqa: ARG005
+    )
 
+    processed_any, _, _ = scheduler._ensure_radar_backlog()
 
+    assert processed_any is False
+    assert scheduler._rendered_backlog is True
+
+
+def test_prune_radar_outputs_keeps_newest_stubs(tmp_path):
+    scheduler = make_scheduler()
+    storage = replace(
+        scheduler.config.storage,
+        radar_data_dir=tmp_path / "data",
+        radar_output_dir=tmp_path / "out",
+        max_tracked_files=2,
+    )
+    scheduler.config = replace(scheduler.config, storage=storage)
+    storage.radar_output_dir.mkdir()
+    for stub in ("20250926_2000", "20250926_2005", "20250926_2010"):
+        for variant in ("overlay", "overlay2x"):
+            (storage.radar_output_dir / f"radar_{stub}_{variant}.png").touch()
+    (storage.radar_output_dir / "radar_notes.png").touch()
+
+    scheduler._prune_radar_outputs()
+
+    assert sorted(path.name for path in storage.radar_output_dir.iterdir()) == [
+        "radar_20250926_2005_overlay.png",
+        "radar_20250926_2005_overlay2x.png",
+        "radar_20250926_2010_overlay.png",
+        "radar_20250926_2010_overlay2x.png",
+        "radar_notes.png",
+    ]
+
+
+def test_prune_sweeps_only_stale_temp_files(tmp_path):
+    scheduler = make_scheduler()
+    storage = replace(
+        scheduler.config.storage,
+        radar_data_dir=tmp_path / "data",
+        radar_output_dir=tmp_path / "out",
+        max_tracked_files=0,
+    )
+    scheduler.config = replace(scheduler.config, storage=storage)
+    storage.radar_output_dir.mkdir()
+    stale = storage.radar_output_dir / ".radar_20250926_2000_overlay.abc123.tmp"
+    fresh = storage.radar_output_dir / ".radar_20250926_2005_overlay.def456.tmp"
+    stale.touch()
+    fresh.touch()
+    os.utime(stale, (0, 0))
+
+    scheduler._prune_radar_outputs()
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_next_expected_rolls_over_day_boundary():
+    scheduler = make_scheduler()
+
+    assert scheduler._calculate_next_expected(datetime(2025, 9, 26, 20, 0)) == datetime(2025, 9, 26, 20, 5)
+    assert scheduler._calculate_next_expected(datetime(2025, 9, 26, 20, 4, 59, 900)) == datetime(2025, 9, 26, 20, 5)
+    assert scheduler._calculate_next_expected(datetime(2025, 9, 30, 23, 57, 30)) == datetime(2025, 10, 1, 0, 0)
+
+
+def test_extended_backlog_skipped_on_idle_cycles():
+    scheduler = RadarScheduler()
+    results = iter([(True, None, False), (False, None, False), (False, None, False)])
+    scheduler._radar_entries = MethodType(lambda self: [], scheduler)
+    scheduler._ensure_radar_backlog = MethodType(lambda self: next(results), scheduler)
+    scheduler._download_forecast_tar = MethodType(lambda self: None, scheduler)
+    extended = Mock()
+    scheduler._ensure_extended_backlog = extended
+
+    scheduler.run_cycle()  # new data
+    scheduler.run_cycle()  # idle retry
+    assert extended.call_count == 1
+
+    scheduler._cycles = 12
+    scheduler.run_cycle()
+    assert extended.call_count == 2
+
+
+def test_run_cycle_lists_radar_entries_once(monkeypatch):
+    scheduler = RadarScheduler()
+    download_tar = Mock(return_value=None)
+    scheduler._download_forecast_tar = download_tar
+    listing = Mock(return_value=[])
+    monkeypatch.setattr("new_version.scheduler.list_remote_files", listing)
+
+    scheduler.run_cycle()  # first cycle runs both the radar and extended backlogs
+    assert listing.call_count == 1
+
+    scheduler.run_cycle()
+    assert listing.call_count == 2
+    download_tar.assert_not_called()  # no radar timestamp to pair a forecast with
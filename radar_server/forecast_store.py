@@ -1,7 +1,9 @@
 """On-disk store for computed forecast fields.
 
-Forecast generation writes each extrapolated :class:`RadarField` to a
-compressed ``.npz`` file under the forecast product's ``field_dir``. These
+Forecast generation writes each extrapolated :class:`RadarField` to an
+``.npz`` file under the forecast product's ``field_dir``; the float32 values
+are stored Blosc/zstd-compressed with bit-shuffling, which is both smaller and
+several times faster to write and read than deflating the whole archive. These
 files act as the "inputs" of forecast frame rendering, mirroring how observed
 products consume downloaded HDF files: rendering becomes ordinary, idempotent,
 restart-durable work driven by the filesystem.
@@ -19,6 +21,7 @@ from pathlib import Path
 from typing import Iterable, Mapping
 
 import numpy as np
+from numcodecs import Blosc
 
 from .config import ForecastProduct
 from .render_jobs import output_base
@@ -29,6 +32,7 @@ LOGGER = logging.getLogger(__name__)
 FIELD_SUFFIX = ".npz"
 _PART_SUFFIX = ".part"
 _STALE_PART_SECONDS = 3600
+_VALUES_CODEC = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
 
 
 @dataclass(frozen=True)
@@ -80,10 +84,12 @@ def save_field(field: RadarField, path: Path, *, issue_timestamp: datetime, minu
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_name(path.name + _PART_SUFFIX)
     transform = field.transform
+    values = np.ascontiguousarray(field.values, dtype=np.float32)
     with tmp_path.open("wb") as fh:
-        np.savez_compressed(
+        np.savez(
             fh,
-            values=field.values,
+            values_blosc=np.frombuffer(_VALUES_CODEC.encode(values), dtype=np.uint8),
+            values_shape=np.asarray(values.shape, dtype=np.int64),
             x_min=transform.x_min,
             y_max=transform.y_max,
             px=transform.px,
@@ -110,7 +116,7 @@ def load_field(path: Path) -> StoredForecastField:
             height=int(data["height"]),
         )
         field = RadarField(
-            values=np.asarray(data["values"], dtype=np.float32),
+            values=_load_values(data),
             crs=str(data["crs"]),
             transform=transform,
             quantity=str(data["quantity"]),
@@ -123,6 +129,14 @@ def load_field(path: Path) -> StoredForecastField:
         )
 
 
+def _load_values(data) -> np.ndarray:
+    if "values" in data.files:  # written before values were Blosc-encoded
+        return np.asarray(data["values"], dtype=np.float32)
+    values = np.empty(tuple(data["values_shape"]), dtype=np.float32)
+    _VALUES_CODEC.decode(data["values_blosc"], out=values)
+    return values
+
+
 def read_field_metadata(path: Path) -> tuple[datetime, int]:
     """Return ``(issue_timestamp, minute)`` without materializing values."""
 
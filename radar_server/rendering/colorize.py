@@ -8,12 +8,20 @@ indexed image directly (no lossy 16-color quantize pass needed downstream).
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import numpy as np
 
 from .core import PaletteSpec, RadarField, Rgba
 
+try:  # numba fuses the binning into one pass, but keep the module importable without it
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except Exception:  # pragma: no cover - exercised only on installs without numba
+    _HAVE_NUMBA = False
+
 
 @dataclass(frozen=True)
 class IndexedImage:
@@ -33,6 +41,46 @@ class IndexedImage:
     nodata_rgba: Optional[Tuple[int, int, int, int]] = None
 
 
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _bin_rows(values, levels, rows, nodata_index, out):
+        """Fused NaN check + level search + palette lookup in one pass.
+
+        Matches ``rows[searchsorted(levels, v, side="right")]`` with NaN mapped
+        to ``nodata_index``, without the int64 positions temporary. Serial on
+        purpose, like the decode kernel: it runs on ``render_batch`` threads.
+        """
+        nlevels = levels.shape[0]
+        for i in range(values.shape[0]):
+            for j in range(values.shape[1]):
+                v = values[i, j]
+                if np.isnan(v):
+                    out[i, j] = nodata_index
+                    continue
+                position = 0
+                while position < nlevels and levels[position] <= v:
+                    position += 1
+                out[i, j] = rows[position]
+
+
+@lru_cache(maxsize=16)
+def _palette_tables(palette: PaletteSpec) -> Tuple[np.ndarray, Tuple[Tuple[int, int, int], ...], np.ndarray]:
+    """Per-palette lookup tables, built once (palettes are frozen, hashable specs).
+
+    Returns the breakpoints as an array, the parsed RGB colors, and a table
+    mapping each ``searchsorted`` position to a palette index: position 0
+    (below the floor) is the transparent slot, positions past the last level
+    clamp to the top color. The arrays are shared, so they are read-only.
+    """
+    ncolors = len(palette.colors)
+    levels = np.asarray(palette.levels, dtype=np.float64)
+    rows = np.array([ncolors, *range(ncolors), ncolors - 1], dtype=np.uint8)
+    levels.flags.writeable = False
+    rows.flags.writeable = False
+    return levels, tuple(palette.rgb), rows
+
+
 def colorize(
     field: RadarField,
     palette: PaletteSpec,
@@ -44,36 +92,38 @@ def colorize(
             f"palette {palette.name!r} is for {palette.quantity}, field is {field.quantity}"
         )
 
-    levels = np.asarray(palette.levels, dtype=np.float64)
-    ncolors = len(palette.colors)
+    levels, rgb, rows = _palette_tables(palette)
+    ncolors = len(rgb)
     values = field.values
 
-    # bin index: colors[i] covers [levels[i], levels[i+1]); clamp top, mark below.
-    idx = np.searchsorted(levels, values, side="right") - 1
-    nodata = np.isnan(values)
-    below_floor = idx < 0  # clear-sky (-inf) and below-threshold valid cells
-    np.clip(idx, 0, ncolors - 1, out=idx)
-
     transparent_index = ncolors
-    indices = idx.astype(np.uint8)
+    # Missing-data cells get their own partially transparent fill only when
+    # one is requested; otherwise they fold into the transparent slot.
+    nodata_index = transparent_index if nodata_fill is None else ncolors + 1
+
+    # bin index: colors[i] covers [levels[i], levels[i+1]); clamp top, and
+    # below-floor cells (clear-sky -inf included) land on the transparent slot.
+    if _HAVE_NUMBA and values.ndim == 2:
+        indices = np.empty(values.shape, dtype=np.uint8)
+        _bin_rows(values, levels, rows, nodata_index, indices)
+    else:
+        # One gather straight to uint8: no signed index array, clip or floor mask.
+        # Positions are always valid rows, so "clip" just skips bounds checks.
+        indices = rows.take(np.searchsorted(levels, values, side="right"), mode="clip")
+        indices[np.isnan(values)] = nodata_index  # searchsorted sorts NaN past the top level
 
     if nodata_fill is None:
         # Default: missing data and below-floor both fully transparent.
-        indices[nodata | below_floor] = transparent_index
         return IndexedImage(
             indices=indices,
-            palette=palette.rgb,
+            palette=list(rgb),
             transparent_index=transparent_index,
         )
 
-    # Missing-data cells get their own partially transparent fill; clear-sky and
-    # below-floor cells stay fully transparent.
-    nodata_index = ncolors + 1
-    indices[below_floor] = transparent_index
-    indices[nodata] = nodata_index
+    # Clear-sky and below-floor cells stay fully transparent.
     return IndexedImage(
         indices=indices,
-        palette=palette.rgb,
+        palette=list(rgb),
         transparent_index=transparent_index,
         nodata_index=nodata_index,
         nodata_rgba=(nodata_fill.r, nodata_fill.g, nodata_fill.b, nodata_fill.alpha_byte),
@@ -68,10 +68,12 @@ def composite_to_web_mercator(
 
     target = _target_grid(fields, bounds)
 
-    accumulator = np.full((target.height, target.width), np.nan, dtype=np.float32)
-    for field in fields:
+    # Seed with the first resampled field (already NaN outside its footprint)
+    # rather than a NaN-filled grid, then fold the rest in place.
+    accumulator = resample_to_grid(fields[0], target)
+    for field in fields[1:]:
         # fmax: real echoes win over NaN; overlapping echoes resolve to the max.
-        accumulator = np.fmax(accumulator, resample_to_grid(field, target))
+        np.fmax(accumulator, resample_to_grid(field, target), out=accumulator)
 
     return RadarField(
         values=accumulator,
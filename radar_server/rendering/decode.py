@@ -18,6 +18,13 @@ from pyproj import Transformer
 
 from .core import GeoTransform, RadarField
 
+try:  # numba speeds up float rasters, but keep the decoder importable without it
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except Exception:  # pragma: no cover - exercised only on installs without numba
+    _HAVE_NUMBA = False
+
 # Products that represent a 2D composite we can render directly.
 _COMPOSITE_PRODUCTS = ("MAX", "MAXZ", "COMP", "SURF")
 
@@ -54,6 +61,60 @@ def _select_dataset(hdf: h5py.File, quantity: str) -> str:
     )
 
 
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _scale_rows(raw, gain, offset, nodata, undetect, out):
+        """Fused scale + sentinel patch: one read, one write.
+
+        Deliberately serial: decode runs inside ``render_batch``'s thread pool,
+        which already parallelises per file, and concurrent ``parallel=True``
+        launches abort numba's default workqueue threading layer.
+
+        No fastmath: the NaN/sentinel comparisons and the separate multiply and
+        add must match the numpy fallback bit for bit.
+        """
+        for i in range(raw.shape[0]):
+            for j in range(raw.shape[1]):
+                v = raw[i, j]
+                if v == undetect:
+                    out[i, j] = -np.inf
+                elif v == nodata:
+                    out[i, j] = np.nan
+                else:
+                    out[i, j] = v * gain + offset
+
+
+def _to_values(raw: np.ndarray, gain: float, offset: float, nodata: float, undetect: float) -> np.ndarray:
+    """Scale raw counts to physical units: NaN for nodata, -inf for undetect.
+
+    Clear-sky ("undetect") is forced below any palette floor so it renders
+    transparent regardless of quantity or palette.
+    """
+    if raw.dtype in (np.uint8, np.uint16):
+        # Every possible count maps to a fixed value: build that table once and
+        # gather through it, a single pass over the grid with no masks.
+        table = (np.arange(np.iinfo(raw.dtype).max + 1) * gain + offset).astype(np.float32)
+        for sentinel, fill in ((nodata, np.nan), (undetect, -np.inf)):
+            if float(sentinel).is_integer() and 0 <= sentinel < table.size:
+                table[int(sentinel)] = fill
+        return table[raw]
+
+    # Same precision numpy would use for ``raw * gain + offset``: float rasters
+    # keep their own width, integer rasters compute in float64.
+    scalar = raw.dtype.type if raw.dtype.kind == "f" else np.float64
+    if _HAVE_NUMBA and raw.ndim == 2:
+        values = np.empty(raw.shape, dtype=np.float32)
+        _scale_rows(raw, scalar(gain), scalar(offset), scalar(nodata), scalar(undetect), values)
+        return values
+
+    # One scaling pass, then patch the sentinels in place (undetect wins ties).
+    values = np.asarray(raw * gain + offset, dtype=np.float32)
+    np.putmask(values, raw == nodata, np.nan)
+    np.putmask(values, raw == undetect, -np.inf)
+    return values
+
+
 def load_odim_hdf(path: Path, quantity: str = "DBZH") -> RadarField:
     with h5py.File(path, "r") as hdf:
         what = hdf["what"].attrs
@@ -70,7 +131,10 @@ def load_odim_hdf(path: Path, quantity: str = "DBZH") -> RadarField:
 
         dataset = _select_dataset(hdf, quantity)
         group = hdf[f"{dataset}/data1"]
-        raw = group["data"][...]
+        data = group["data"]
+        # Decompress straight into an exactly-sized array (no intermediate copy)
+        raw = np.empty(data.shape, dtype=data.dtype)
+        data.read_direct(raw)
         meta = group["what"].attrs
         gain = float(meta["gain"])
         offset = float(meta["offset"])
@@ -82,11 +146,6 @@ def load_odim_hdf(path: Path, quantity: str = "DBZH") -> RadarField:
     x_min, y_max = to_src.transform(ul_lon, ul_lat)
     transform = GeoTransform(x_min=x_min, y_max=y_max, px=xscale, py=yscale, width=xsize, height=ysize)
 
-    values = np.full(raw.shape, np.nan, dtype=np.float32)
-    valid = (raw != nodata) & (raw != undetect)
-    values[valid] = raw[valid] * gain + offset
-    # Clear-sky ("undetect"): force below any palette floor so it renders
-    # transparent regardless of quantity or palette.
-    values[raw == undetect] = -np.inf
+    values = _to_values(raw, gain, offset, nodata, undetect)
 
     return RadarField(values=values, crs=projdef, transform=transform, quantity=quantity, timestamp=timestamp)
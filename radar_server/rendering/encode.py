@@ -160,7 +160,16 @@ def write_png(
     tmp = path.with_suffix(".tmp.png")
     try:
         step_start = time.perf_counter()
-        img.save(tmp, format="PNG", transparency=_transparency(image), optimize=False)
+        # oxipng re-deflates the image data from scratch, so when it runs the
+        # initial deflate only needs to be fast, not small.
+        compress_level = 1 if optimize else 6
+        img.save(
+            tmp,
+            format="PNG",
+            transparency=_transparency(image),
+            optimize=False,
+            compress_level=compress_level,
+        )
         if timings is not None:
             timings.save += time.perf_counter() - step_start
         if optimize:
@@ -23,7 +23,7 @@ from PIL import Image
 from radar_server.rendering.colorize import colorize
 from radar_server.rendering.composite import composite_to_web_mercator
 from radar_server.rendering.core import WEB_MERCATOR, GeoTransform, PaletteSpec, RadarField
-from radar_server.rendering.decode import load_odim_hdf
+from radar_server.rendering.decode import _to_values, load_odim_hdf
 from radar_server.rendering.downsample import downsample_max
 from radar_server.rendering.palettes import EXTENDED_DBZH, STANDARD_DBZH
 from radar_server.rendering.pipeline import render_batch, render_composite_png, render_radar_png
@@ -38,9 +38,9 @@ _MERC = (
 _UL_LON, _UL_LAT = 11.2669, 51.4584
 
 
-def _write_synthetic_odim(path: Path) -> Path:
+def _write_synthetic_odim(path: Path, dtype: type = np.uint8) -> Path:
     height, width = 16, 20
-    raw = np.zeros((height, width), dtype=np.uint8)  # 0 == undetect (clear sky)
+    raw = np.zeros((height, width), dtype=dtype)     # 0 == undetect (clear sky)
     raw[4:10, 5:15] = 120                            # 120*0.5-32 = 28 dBZ block
     raw[6, 8] = 180                                  # 180*0.5-32 = 58 dBZ peak
     raw[0, 0] = 255                                  # 255 == nodata
@@ -138,6 +138,16 @@ def test_decode_raises_for_missing_quantity() -> None:
         load_odim_hdf(_sample(), quantity="RATE")
 
 
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+def test_decode_values_mark_nodata_and_undetect(dtype) -> None:
+    raw = np.array([[0, 1, 64], [255, 96, 0]], dtype=dtype)
+    values = _to_values(raw, gain=0.5, offset=-32.0, nodata=255.0, undetect=0.0)
+    assert values.dtype == np.float32
+    assert np.isneginf(values[0, 0]) and np.isneginf(values[1, 2])
+    assert np.isnan(values[1, 0])
+    assert values[0, 1] == -31.5 and values[0, 2] == 0.0 and values[1, 1] == 16.0
+
+
 # --- reproject ----------------------------------------------------------------
 
 def test_reproject_is_web_mercator_and_preserves_shape() -> None:
@@ -329,6 +339,20 @@ def test_render_batch_skips_failures(tmp_path: Path) -> None:
     assert results[0].variants["overlay"].exists()
 
 
+def test_render_batch_renders_many_files_concurrently(tmp_path: Path) -> None:
+    # Several workers decode and colorize at once; uint8 and float rasters take
+    # different decode paths, and neither may trip up concurrent kernel calls.
+    items = [
+        (_write_synthetic_odim(tmp_path / f"frame{i}.hdf", np.uint8 if i % 2 else np.float32), f"frame{i}")
+        for i in range(8)
+    ]
+    results = render_batch(items, tmp_path / "out", STANDARD_DBZH, optimize=False)
+    assert sorted(r.base for r in results) == sorted(base for _, base in items)
+    first = np.asarray(Image.open(results[0].variants["overlay"]))
+    for result in results[1:]:
+        np.testing.assert_array_equal(np.asarray(Image.open(result.variants["overlay"])), first)
+
+
 def test_render_batch_rejects_duplicate_bases(tmp_path: Path) -> None:
     with pytest.raises(ValueError):
         render_batch([(_sample(), "dup"), (_sample(), "dup")], tmp_path, STANDARD_DBZH, optimize=False)
@@ -163,3 +163,28 @@ def test_expected_forecast_paths_covers_all_minutes_and_variants(tmp_path: Path)
     names = {path.name for path in paths}
     assert "radar_test_20260605_2100_fct10.json" in names
     assert "radar_test_20260605_2100_fct20_overlay.png" in names
+
+
+def test_load_field_reads_legacy_deflated_values(tmp_path: Path) -> None:
+    values = np.array([[10.0, np.nan], [15.0, 20.0]], dtype=np.float32)
+    path = tmp_path / "legacy.npz"
+    np.savez_compressed(
+        path,
+        values=values,
+        x_min=0.0,
+        y_max=100.0,
+        px=1.0,
+        py=1.0,
+        width=2,
+        height=2,
+        crs=WEB_MERCATOR,
+        quantity="DBZH",
+        valid_timestamp=datetime(2026, 6, 5, 21, 10).isoformat(),
+        issue_timestamp=ISSUE.isoformat(),
+        minute=10,
+    )
+
+    stored = forecast_store.load_field(path)
+
+    np.testing.assert_array_equal(stored.field.values, values)
+    assert stored.minute == 10